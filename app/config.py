@@ -6,6 +6,7 @@ class ConfigManager:
     def __init__(self, config_file="config.json"):
         self.config_file = config_file
         self.config = self.load_config()
+        self._rebuild_saved_index()
     
     def load_config(self):
         if os.path.exists(self.config_file):
@@ -38,18 +39,25 @@ class ConfigManager:
     def get_saved_password(self, ssid):
         return self.config.get('saved_networks', {}).get(ssid)
     
+    def _rebuild_saved_index(self):
+        # Niezmienny zbiór SSID zapisanych sieci - podmieniany w całości, więc można go
+        # czytać z wątku NetworkManagera bez blokad
+        self._saved_index = frozenset(self.config.get('saved_networks', {}))
+
     def save_network(self, ssid, password):
         if 'saved_networks' not in self.config:
             self.config['saved_networks'] = {}
         self.config['saved_networks'][ssid] = password
+        self._rebuild_saved_index()
         self.save_config()
     
     def forget_network(self, ssid):
         if 'saved_networks' in self.config and ssid in self.config['saved_networks']:
             del self.config['saved_networks'][ssid]
+            self._rebuild_saved_index()
             self.save_config()
             return True
         return False
     
     def get_saved_networks(self):
-        return list(self.config.get('saved_networks', {}).keys())
\ No newline at end of file
+        return self._saved_index
\ No newline at end of file
@@ -0,0 +1,76 @@
+def band_for_frequency(frequency: int) -> str:
+    if frequency >= 5925:
+        return "6GHz"
+    if frequency >= 4900:
+        return "5GHz"
+    return "2.4GHz"
+
+
+class AccessPoint:
+    """Pojedynczy BSSID widziany przez NM (obiekt org.freedesktop.NetworkManager.AccessPoint).
+
+    Rekordy żyją w tabeli NetworkManager kluczowanej ścieżką obiektu i są aktualizowane
+    w miejscu - kolejne skany i sygnały PropertiesChanged nie tworzą nowych obiektów.
+    """
+
+    __slots__ = ("path", "device", "bssid", "ssid", "strength", "frequency",
+                 "flags", "wpa_flags", "rsn_flags", "last_seen")
+
+    # Właściwość NM -> (pole rekordu, konwersja)
+    _FIELDS = {
+        "HwAddress": ("bssid", str),
+        "Ssid": ("ssid", bytes),
+        "Strength": ("strength", int),
+        "Frequency": ("frequency", int),
+        "Flags": ("flags", int),
+        "WpaFlags": ("wpa_flags", int),
+        "RsnFlags": ("rsn_flags", int),
+        "LastSeen": ("last_seen", int),
+    }
+
+    def __init__(self, path: str, device: str | None = None):
+        self.path = path
+        self.device = device
+        self.bssid = ""
+        self.ssid = b""
+        self.strength = 0
+        self.frequency = 0
+        self.flags = 0
+        self.wpa_flags = 0
+        self.rsn_flags = 0
+        self.last_seen = -1
+
+    @classmethod
+    def from_props(cls, path: str, props: dict, device: str | None = None) -> "AccessPoint":
+        ap = cls(path, device)
+        ap.update(props)
+        return ap
+
+    def update(self, props: dict) -> bool:
+        """Nakłada (rozpakowane) właściwości NM; zwraca True, jeśli coś się zmieniło."""
+        changed = False
+        for name, value in props.items():
+            field = self._FIELDS.get(name)
+            if field is None:
+                continue
+            attr, convert = field
+            value = convert(value)
+            if getattr(self, attr) != value:
+                setattr(self, attr, value)
+                changed = True
+        return changed
+
+    @property
+    def ssid_text(self) -> str:
+        return self.ssid.decode("utf-8", errors="ignore")
+
+    @property
+    def secured(self) -> bool:
+        return bool(self.wpa_flags or self.rsn_flags or self.flags)
+
+    @property
+    def band(self) -> str:
+        return band_for_frequency(self.frequency)
+
+    def __repr__(self):
+        return f"AccessPoint({self.bssid or self.path}, {self.ssid_text!r}, {self.strength}%, {self.frequency} MHz)"
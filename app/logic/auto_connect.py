@@ -0,0 +1,149 @@
+import asyncio
+import time
+from typing import Dict, List, Tuple
+
+DEFAULT_COOLDOWN = 20.0      # s między dowolnymi dwiema próbami
+DEFAULT_BACKOFF = 30.0       # s po pierwszej nieudanej próbie dla danego SSID
+MAX_BACKOFF = 15 * 60.0      # górna granica backoffu (podwaja się po każdej porażce)
+
+
+def backoff_delay(failures: int) -> float:
+    """Przerwa po `failures` kolejnych porażkach z tą samą siecią.
+
+    >>> [backoff_delay(n) for n in (1, 2, 3, 10)]
+    [30.0, 60.0, 120.0, 900.0]
+    """
+    return min(MAX_BACKOFF, DEFAULT_BACKOFF * 2 ** (failures - 1))
+
+
+class AutoConnect:
+    """Automatyczne łączenie z zapisanymi sieciami, gdy nie ma połączenia.
+
+    Działa wyłącznie w wątku pętli asyncio NetworkManagera: `evaluate()` jest wołane po
+    każdej publikacji snapshotu (i z timera, gdy czekamy na cooldown/backoff). Kandydaci to
+    widoczne sieci z indeksu zapisanych w aplikacji (config) - jedno przejście
+    po snapshocie i wyszukiwania w zbiorach, więc koszt rośnie liniowo z liczbą sieci.
+    Ranking: ocena najlepszego BSSID (pasmo, wygładzony sygnał, zatłoczenie) razy odsetek
+    udanych połączeń z tą siecią. Naraz trwa najwyżej jedna próba.
+    """
+
+    def __init__(self, manager, config=None):
+        self._manager = manager
+        self._config = config
+        self._cooldown = float(config.get('auto_connect_cooldown', DEFAULT_COOLDOWN)) if config else DEFAULT_COOLDOWN
+        self.paused = False  # np. Wi-Fi wyłączone w UI
+        self._task = None
+        self._timer = None
+        self._last_attempt = float("-inf")
+        # SSID -> [udane, nieudane] (wszystkie połączenia, także ręczne)
+        self._history: Dict[str, List[int]] = {}
+        # SSID -> (kolejne porażki, najwcześniejsza następna próba)
+        self._backoff: Dict[str, Tuple[int, float]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._config and self._config.get('auto_connect', False)) and not self.paused
+
+    def record(self, result):
+        """Zapamiętuje wynik łączenia (ConnectResult) dla rankingu i backoffu."""
+        stats = self._history.setdefault(result.ssid, [0, 0])
+        if result.success:
+            stats[0] += 1
+            self._backoff.pop(result.ssid, None)
+        else:
+            stats[1] += 1
+            failures = self._backoff.get(result.ssid, (0, 0.0))[0] + 1
+            self._backoff[result.ssid] = (failures, time.monotonic() + backoff_delay(failures))
+
+    def success_rate(self, ssid: str) -> float:
+        """Odsetek udanych połączeń (wygładzony).
+
+        >>> AutoConnect(manager=None).success_rate("Home")
+        0.5
+        """
+        succeeded, failed = self._history.get(ssid, (0, 0))
+        return (succeeded + 1) / (succeeded + failed + 2)  # wygładzenie Laplace'a: nieznana sieć = 0.5
+
+    def candidates(self, snapshot, now: float | None = None) -> List[Tuple[float, str]]:
+        """(ocena, SSID) widocznych zapisanych sieci, od najlepszej; pomija sieci w backoffie."""
+        now = time.monotonic() if now is None else now
+        # Tylko sieci zapamiętane w aplikacji - nie każdy profil NM (np. płatny hotspot
+        # z connection.autoconnect=no nie powinien być aktywowany bez pytania)
+        saved = self._config.get_saved_networks() if self._config else frozenset()
+        ranked = []
+        for net in snapshot.networks:
+            ssid = net["ssid"]
+            if ssid not in saved:
+                continue
+            backoff = self._backoff.get(ssid)
+            if backoff is not None and backoff[1] > now:
+                continue
+            ranked.append((net.get("score", net.get("strength", 0)) * self.success_rate(ssid), ssid))
+        ranked.sort(reverse=True)
+        return ranked
+
+    def evaluate(self):
+        """Startuje próbę, jeśli jest po co i wolno; w przeciwnym razie ewentualnie planuje ponowne sprawdzenie."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        manager = self._manager
+        if not self.enabled or self._task is not None or manager.current_network or manager.connects_in_flight:
+            return
+
+        now = time.monotonic()
+        wait = self._last_attempt + self._cooldown - now
+        if wait > 0:
+            self._timer = manager._loop.call_later(wait, self.evaluate)
+            return
+
+        ranked = self.candidates(manager.snapshot, now)
+        if not ranked:
+            # Może któraś znana sieć jest tylko w backoffie - sprawdź ponownie, gdy minie
+            visible = {net["ssid"] for net in manager.snapshot.networks}
+            pending = [until for ssid, (_n, until) in self._backoff.items() if until > now and ssid in visible]
+            if pending:
+                self._timer = manager._loop.call_later(min(pending) - now, self.evaluate)
+            return
+
+        ssid = ranked[0][1]
+        self._last_attempt = now
+        self._task = manager._loop.create_task(self._attempt(ssid))
+
+    async def _attempt(self, ssid: str):
+        manager = self._manager
+        print(f"[NM LOG] Auto-connect: trying {ssid}")
+        manager.auto_connect_started.emit(ssid)
+        try:
+            password = self._config.get_saved_password(ssid) if self._config else None
+            result = await manager._async_connect(ssid, password)
+            print(f"[NM LOG] Auto-connect to {ssid}: {result.success} ({result.reason_text})")
+            manager.connect_finished.emit(result)
+        except Exception as e:
+            print(f"[NM LOG] Auto-connect to {ssid} failed: {e}")
+        finally:
+            self._task = None
+        self.evaluate()
+
+    async def cancel_attempt(self):
+        """Przerywa trwającą próbę (np. użytkownik łączy ręcznie) - bez zapisu wyniku i bez connect_finished.
+
+        Naraz ma trwać najwyżej jedno łączenie: NM i tak dezaktywowałby jedną z dwóch aktywacji,
+        a przerwana próba auto trafiłaby do backoffu i pokazała "Failed" w UI.
+        """
+        task = self._task
+        if task is None or task.done():
+            return
+        print("[NM LOG] Auto-connect attempt cancelled by a manual connect")
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def stop(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._task is not None:
+            self._task.cancel()
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from typing import Callable, Iterable, List
+
+from app.logic.access_point import AccessPoint
+
+# Względna przepustowość pasma przy tym samym sygnale (szersze kanały, mniej zakłóceń)
+BAND_CAPACITY = {"2.4GHz": 1.0, "5GHz": 2.5, "6GHz": 3.0}
+MIN_USABLE_STRENGTH = 20  # poniżej - praktycznie brak łącza
+FULL_STRENGTH = 80        # powyżej - sygnał nie jest już ograniczeniem
+CONGESTION_PENALTY = 0.3  # spadek przepustowości na jednego "pełnego" sąsiada na kanale
+
+
+@dataclass(frozen=True)
+class BssidScore:
+    """Ocena jednego BSSID: szacowana względna przepustowość w skali 0-100."""
+    bssid: str
+    path: str
+    device: str | None
+    band: str
+    frequency: int
+    strength: int
+    congestion: float
+    score: float
+
+
+def signal_factor(strength: float) -> float:
+    return min(1.0, max(0.0, (strength - MIN_USABLE_STRENGTH) / (FULL_STRENGTH - MIN_USABLE_STRENGTH)))
+
+
+def score_bssid(band: str, strength: float, congestion: float) -> float:
+    """Ocena 0-100: pojemność pasma razy współczynnik sygnału, pomniejszona przez zatłoczenie kanału.
+
+    >>> score_bssid("5GHz", 80, 0.0), score_bssid("2.4GHz", 80, 0.0), score_bssid("5GHz", 50, 1.0)
+    (83.3, 33.3, 32.1)
+    """
+    capacity = BAND_CAPACITY.get(band, 1.0) / max(BAND_CAPACITY.values())
+    return round(100.0 * capacity * signal_factor(strength) / (1.0 + CONGESTION_PENALTY * congestion), 1)
+
+
+def rank_bssids(candidates: Iterable[AccessPoint], congestion: Callable[[AccessPoint], float],
+                strength: Callable[[AccessPoint], float] = lambda ap: ap.strength) -> List[BssidScore]:
+    """Ranking BSSID (np. jednego SSID) od najlepszego; przy równej ocenie wygrywa silniejszy sygnał.
+    `congestion` zwraca zakłócenia na kanale AP (zob. channel_analysis.ChannelReport.interference)."""
+    ranking = []
+    for ap in candidates:
+        value = strength(ap)
+        congestion_value = round(congestion(ap), 2)
+        ranking.append(BssidScore(ap.bssid, ap.path, ap.device, ap.band, ap.frequency, value,
+                                  congestion_value, score_bssid(ap.band, value, congestion_value)))
+    ranking.sort(key=lambda s: (s.score, s.strength), reverse=True)
+    return ranking
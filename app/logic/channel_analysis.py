@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List
+
+from app.logic.access_point import AccessPoint, band_for_frequency
+
+try:
+    import numpy as np
+except ImportError:  # NumPy jest opcjonalny - bez niego liczymy w czystym Pythonie
+    np = None
+
+# Szerokość kanału do liczenia nakładania: w 2.4 GHz maska ~22 MHz przy odstępie 5 MHz,
+# w 5/6 GHz kanały 20 MHz leżą obok siebie bez nakładania
+CHANNEL_WIDTH_24GHZ = 22
+CHANNEL_WIDTH = 20
+
+
+def channel_for_frequency(frequency: int) -> int:
+    """Numer kanału dla częstotliwości środkowej (MHz); 0 = nieznana.
+
+    >>> [channel_for_frequency(f) for f in (2412, 2484, 4920, 5180, 5825, 5935, 5955)]
+    [1, 14, 184, 36, 165, 2, 1]
+    """
+    if frequency == 2484:
+        return 14
+    if 2412 <= frequency < 2484:
+        return (frequency - 2407) // 5
+    if frequency == 5935:
+        return 2  # wyjątek w numeracji 6 GHz
+    if frequency >= 5950:
+        return (frequency - 5950) // 5
+    if frequency >= 5000:
+        return (frequency - 5000) // 5
+    if frequency >= 4900:
+        return (frequency - 4000) // 5  # 4.9 GHz (Japonia / public safety): kanały 180-199
+    return 0
+
+
+def overlap(freq_a: int, freq_b: int) -> float:
+    """Udział zakłóceń między kanałami: 1.0 dla tego samego, malejąco do 0 przy braku nakładania."""
+    width = CHANNEL_WIDTH_24GHZ if freq_a < 4900 and freq_b < 4900 else CHANNEL_WIDTH
+    return max(0.0, 1.0 - abs(freq_a - freq_b) / width)
+
+
+@dataclass(frozen=True)
+class ChannelStats:
+    """Zajętość jednego kanału. `load` to suma sił sygnału BSSID na kanale (1.0 = jeden AP
+    przy 100%), `interference` - obciążenie ważone nakładaniem z kanałów sąsiednich (łącznie z tym)."""
+    frequency: int
+    channel: int
+    band: str
+    count: int
+    load: float
+    interference: float
+
+
+class ChannelReport:
+    """Niezmienny wynik analizy kanałów dla jednego stanu tabeli AP (`generation`)."""
+
+    __slots__ = ("generation", "channels", "_ap_interference")
+
+    def __init__(self, generation: int, channels: Dict[int, ChannelStats], ap_interference: Dict[str, float]):
+        object.__setattr__(self, "generation", generation)
+        object.__setattr__(self, "channels", MappingProxyType(dict(sorted(channels.items()))))
+        object.__setattr__(self, "_ap_interference", MappingProxyType(ap_interference))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ChannelReport is immutable")
+
+    def interference(self, ap_path: str) -> float:
+        """Zakłócenia widziane przez AP od innych BSSID (bez niego samego)."""
+        return self._ap_interference.get(ap_path, 0.0)
+
+    def busiest(self, band: str | None = None) -> List[ChannelStats]:
+        stats = [c for c in self.channels.values() if band is None or c.band == band]
+        return sorted(stats, key=lambda c: c.interference, reverse=True)
+
+    def __repr__(self):
+        return f"ChannelReport(gen {self.generation}, {len(self.channels)} channels)"
+
+
+def analyze(access_points: Iterable[AccessPoint], strength: Callable[[AccessPoint], float] = lambda ap: ap.strength,
+            generation: int = 0) -> ChannelReport:
+    """Zajętość i zakłócenia per kanał dla wszystkich widocznych AP naraz.
+
+    Liczone na poziomie kanałów, nie par AP: obciążenie sumuje się per częstotliwość,
+    a macierz nakładania ma rozmiar (liczba kanałów)^2 - setki BSSID nie zwiększają kosztu
+    kwadratowo. Ten sam BSSID widziany przez kilka adapterów liczy się raz.
+    """
+    unique: Dict[str, AccessPoint] = {}
+    paths: Dict[str, List[str]] = {}
+    for ap in access_points:
+        if not ap.frequency:
+            continue
+        key = ap.bssid or ap.path
+        unique.setdefault(key, ap)
+        paths.setdefault(key, []).append(ap.path)
+    if not unique:
+        return ChannelReport(generation, {}, {})
+
+    keys = list(unique)
+    freqs = [unique[k].frequency for k in keys]
+    loads = [strength(unique[k]) / 100.0 for k in keys]
+
+    if np is not None:
+        f = np.asarray(freqs, dtype=np.float64)
+        s = np.asarray(loads, dtype=np.float64)
+        channel_freqs, inverse = np.unique(f, return_inverse=True)
+        count = np.bincount(inverse, minlength=len(channel_freqs))
+        load = np.bincount(inverse, weights=s, minlength=len(channel_freqs))
+        both_24 = (channel_freqs[:, None] < 4900) & (channel_freqs[None, :] < 4900)
+        width = np.where(both_24, CHANNEL_WIDTH_24GHZ, CHANNEL_WIDTH)
+        weights = np.clip(1.0 - np.abs(channel_freqs[:, None] - channel_freqs[None, :]) / width, 0.0, None)
+        interference = weights @ load
+        per_ap = interference[inverse] - s
+        channel_freqs = [int(x) for x in channel_freqs]
+        count, load, interference, per_ap = count.tolist(), load.tolist(), interference.tolist(), per_ap.tolist()
+    else:
+        load_by_freq: Dict[int, float] = {}
+        count_by_freq: Dict[int, int] = {}
+        for freq, value in zip(freqs, loads):
+            load_by_freq[freq] = load_by_freq.get(freq, 0.0) + value
+            count_by_freq[freq] = count_by_freq.get(freq, 0) + 1
+        channel_freqs = sorted(load_by_freq)
+        count = [count_by_freq[c] for c in channel_freqs]
+        load = [load_by_freq[c] for c in channel_freqs]
+        interference = [sum(overlap(c, other) * load_by_freq[other] for other in channel_freqs) for c in channel_freqs]
+        by_freq = dict(zip(channel_freqs, interference))
+        per_ap = [by_freq[freq] - value for freq, value in zip(freqs, loads)]
+
+    channels = {
+        freq: ChannelStats(freq, channel_for_frequency(freq), band_for_frequency(freq),
+                           int(n), round(l, 3), round(i, 3))
+        for freq, n, l, i in zip(channel_freqs, count, load, interference)
+    }
+    ap_interference = {}
+    for key, value in zip(keys, per_ap):
+        for path in paths[key]:
+            ap_interference[path] = round(max(0.0, value), 3)
+    return ChannelReport(generation, channels, ap_interference)
@@ -1,9 +1,20 @@
 import asyncio
+import os
 import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
 from typing import List, Dict, Any
 from PyQt5.QtCore import QObject, pyqtSignal
 from dbus_fast.aio import MessageBus
-from dbus_fast import BusType, Variant
+from dbus_fast import BusType, DBusError, Message, MessageType, Variant
+from dbus_fast import introspection as intr
+from app.logic.access_point import AccessPoint
+from app.logic.auto_connect import AutoConnect
+from app.logic.bssid_scoring import BssidScore, rank_bssids
+from app.logic.channel_analysis import ChannelReport, analyze as analyze_channels
+from app.logic.signal_history import SignalHistory
+from app.logic.snapshot import InterfaceScan, NetworkSnapshot, EMPTY_SNAPSHOT
 
 _SAMPLE_NETWORKS = [
     {"ssid": "Home_WiFi_5G", "strength": 92, "secured": True, "connected": False, "band": "5GHz", "frequency": 5180},
@@ -12,9 +23,82 @@ _SAMPLE_NETWORKS = [
     {"ssid": "Office_Network", "strength": 58, "secured": True, "connected": False, "band": "5GHz", "frequency": 5180},
 ]
 
+# NMActiveConnectionStateReason
+_ACTIVE_STATE_REASONS = {
+    0: "unknown", 1: "none", 2: "user disconnected", 3: "device disconnected",
+    4: "service stopped", 5: "IP config invalid", 6: "connect timeout",
+    7: "service start timeout", 8: "service start failed", 9: "no secrets",
+    10: "login failed", 11: "connection removed", 12: "dependency failed",
+    13: "device realize failed", 14: "device removed",
+}
+
+
+@dataclass(frozen=True)
+class ConnectResult:
+    """Wynik łączenia: końcowy stan ActiveConnection i powód podany przez NM."""
+    ssid: str
+    success: bool
+    state: int
+    reason: int
+
+    @property
+    def reason_text(self) -> str:
+        return _ACTIVE_STATE_REASONS.get(self.reason, f"reason {self.reason}")
+
+
+_INTROSPECTION_DIR = os.path.join(os.path.dirname(__file__), "introspection")
+
+
+def _load_static_interfaces() -> Dict[str, intr.Interface]:
+    """Wczytuje dołączone XML introspekcji interfejsów NM (raz, przy imporcie)."""
+    interfaces = {}
+    try:
+        for filename in sorted(os.listdir(_INTROSPECTION_DIR)):
+            if not filename.endswith(".xml"):
+                continue
+            with open(os.path.join(_INTROSPECTION_DIR, filename)) as f:
+                for iface in intr.Node.parse(f.read()).interfaces:
+                    interfaces[iface.name] = iface
+    except Exception as e:
+        print("[NM LOG] Cannot load bundled introspection data:", e)
+    return interfaces
+
+
+_STATIC_INTERFACES = _load_static_interfaces()
+
+
+def _static_node(*names: str) -> intr.Node | None:
+    if not all(name in _STATIC_INTERFACES for name in names):
+        return None
+    return intr.Node(interfaces=[_STATIC_INTERFACES[name] for name in names])
+
+
+_PROPS = "org.freedesktop.DBus.Properties"
+
+# Znane rodzaje obiektów NM: dokładna ścieżka lub prefiks -> węzeł introspekcji
+_STATIC_NODES = {
+    "/org/freedesktop": _static_node("org.freedesktop.DBus.ObjectManager"),
+    "/org/freedesktop/NetworkManager": _static_node("org.freedesktop.NetworkManager", _PROPS),
+    "/org/freedesktop/NetworkManager/Settings": _static_node("org.freedesktop.NetworkManager.Settings", _PROPS),
+}
+_STATIC_PREFIX_NODES = (
+    ("/org/freedesktop/NetworkManager/Devices/", _static_node(
+        "org.freedesktop.NetworkManager.Device", "org.freedesktop.NetworkManager.Device.Wireless", _PROPS)),
+    ("/org/freedesktop/NetworkManager/AccessPoint/", _static_node("org.freedesktop.NetworkManager.AccessPoint", _PROPS)),
+    ("/org/freedesktop/NetworkManager/ActiveConnection/", _static_node(
+        "org.freedesktop.NetworkManager.Connection.Active", _PROPS)),
+    ("/org/freedesktop/NetworkManager/Settings/", _static_node(
+        "org.freedesktop.NetworkManager.Settings.Connection", _PROPS)),
+)
+
+
 class NetworkManager(QObject):
-    network_changed = pyqtSignal(list)
+    network_changed = pyqtSignal(object)  # NetworkSnapshot
     connection_changed = pyqtSignal(str)
+    scan_finished = pyqtSignal(object)  # NetworkSnapshot
+    connect_finished = pyqtSignal(object)  # ConnectResult
+    active_signal_changed = pyqtSignal(str, int)  # SSID, wygładzona siła AP bieżącego połączenia
+    auto_connect_started = pyqtSignal(str)  # SSID, z którym AutoConnect właśnie próbuje się połączyć
 
     NM_BUS_NAME = "org.freedesktop.NetworkManager"
     NM_PATH = "/org/freedesktop/NetworkManager"
@@ -22,16 +106,96 @@ class NetworkManager(QObject):
     NM_WIFI_IFACE = "org.freedesktop.NetworkManager.Device.Wireless"
     NM_AP_IFACE = "org.freedesktop.NetworkManager.AccessPoint"
     NM_ACTIVE_IFACE = "org.freedesktop.NetworkManager.Connection.Active"
+    NM_SETTINGS_IFACE = "org.freedesktop.NetworkManager.Settings"
+    NM_SETTINGS_CONN_IFACE = "org.freedesktop.NetworkManager.Settings.Connection"
+    NM_SETTINGS_PATH = "/org/freedesktop/NetworkManager/Settings"
     DBUS_PROP_IFACE = "org.freedesktop.DBus.Properties"
+    DBUS_OBJECT_MANAGER_IFACE = "org.freedesktop.DBus.ObjectManager"
+    DBUS_DAEMON_NAME = "org.freedesktop.DBus"
+    DBUS_DAEMON_PATH = "/org/freedesktop/DBus"
+    NM_OBJECT_MANAGER_PATH = "/org/freedesktop"
+    NM_ACTIVE_PREFIX = "/org/freedesktop/NetworkManager/ActiveConnection/"
+    NM_DEVICE_TYPE_WIFI = 2
+    NM_STATIC_INTROSPECTION_VERSION = "1."
+    NM_ERROR_NOT_ALLOWED = "org.freedesktop.NetworkManager.Device.NotAllowed"
+    MIN_SCAN_REQUEST_INTERVAL = 10.0  # s, NM i tak odrzuca częstsze RequestScan
+    SCAN_TIMEOUT = 15.0
+    ACTIVATION_RESULT_TTL = 60.0  # s, jak długo pamiętamy końcowy stan aktywnego połączenia
+    NM_ACTIVE_STATE_UNKNOWN = 0
+    NM_ACTIVE_STATE_ACTIVATED = 2
+    NM_ACTIVE_STATE_DEACTIVATED = 4
+    NM_ACTIVE_REASON_UNKNOWN = 0
+    NM_ACTIVE_REASON_NONE = 1
+    NM_ACTIVE_REASON_CONNECT_TIMEOUT = 6
+    NM_ACTIVE_REASON_NO_SECRETS = 9
+    DEFAULT_DBUS_CONCURRENCY = 8
+    DEFAULT_REFRESH_DEBOUNCE_MS = 250
 
     def __init__(self, config=None):
         super().__init__()
         self.config = config
         self.current_network: str | None = None
-        self.networks: List[Dict[str, Any]] = []
+        # Ostatni opublikowany stan; podmieniany w całości z wątku pętli, czytany z wątku Qt
+        self.snapshot: NetworkSnapshot = EMPTY_SNAPSHOT
         self._loop = asyncio.new_event_loop()
         self._bus = None
         self._running = True
+        # Cache proxy obiektów D-Bus (z introspekcją) po ścieżce obiektu
+        self._proxy_cache: Dict[str, Any] = {}
+        self._static_introspection = True
+        # Widok obiektów NM: ścieżka -> właściwości
+        self._devices: Dict[str, Dict[str, Any]] = {}
+        self._access_points: Dict[str, AccessPoint] = {}
+        self._active_connections: Dict[str, Dict[str, Any]] = {}
+        # Historia siły sygnału po (urządzenie, BSSID) - każdy adapter mierzy ten sam AP osobno;
+        # przeżywa zmianę ścieżki obiektu AP w NM
+        self._signal_history: Dict[tuple, SignalHistory] = {}
+        # Analiza kanałów liczona raz na stan tabeli AP (generacja rośnie przy każdej zmianie AP)
+        self._ap_generation = 0
+        self.channels: ChannelReport = ChannelReport(-1, {}, {})
+        # AP (SpecificObject) bieżącego połączenia i ostatnio wysłana para (SSID, siła)
+        self._active_ap: AccessPoint | None = None
+        self.active_signal: tuple = ("", 0)
+        # Limit równoległych zapytań D-Bus, żeby nie zalać NM przy skanowaniu
+        max_requests = config.get('dbus_concurrency', self.DEFAULT_DBUS_CONCURRENCY) if config else self.DEFAULT_DBUS_CONCURRENCY
+        self._dbus_slots = asyncio.Semaphore(max(1, int(max_requests)))
+        # Harmonogram odświeżania (debounce + deduplikacja skanów w toku)
+        debounce_ms = config.get('refresh_debounce_ms', self.DEFAULT_REFRESH_DEBOUNCE_MS) if config else self.DEFAULT_REFRESH_DEBOUNCE_MS
+        self._refresh_window = max(0, int(debounce_ms)) / 1000.0
+        self._refresh_pending: set = set()
+        self._refresh_waiters: list = []
+        self._refresh_handle = None
+        self._refresh_task = None
+        self.refresh_stats = {"requested": 0, "merged": 0, "runs": 0}
+        # Aktywne skany: urządzenie -> (LastScan przed żądaniem, future) oraz czas ostatniego żądania
+        self._scan_waiters: Dict[str, tuple] = {}
+        self._scan_requested_at: Dict[str, float] = {}
+        # Łączenie: ścieżka ActiveConnection -> future z (stan, powód)
+        self._activation_waiters: Dict[str, asyncio.Future] = {}
+        # Końcowe (state, reason, czas) aktywnych połączeń, które przyszły zanim ktoś na nie czekał
+        self._activation_results: Dict[str, tuple] = {}
+        # Zapisane profile Wi-Fi w NM: SSID (bajty) -> ścieżka profilu, i odwrotnie
+        self._profiles: Dict[bytes, str] = {}
+        self._profile_ssids: Dict[str, bytes] = {}
+        # Łączenie: liczba trwających prób i silnik auto-connect (oba tylko w wątku pętli)
+        self.connects_in_flight = 0
+        self.auto_connect = AutoConnect(self, config)
+        # Unikalna nazwa NM na magistrali i tablica obsługi sygnałów (interfejs, sygnał) -> metoda
+        self._nm_owner: str | None = None
+        self._signal_handlers = {
+            (self.NM_WIFI_IFACE, "AccessPointAdded"): self._on_access_point_added,
+            (self.NM_WIFI_IFACE, "AccessPointRemoved"): self._on_access_point_removed,
+            (self.DBUS_PROP_IFACE, "PropertiesChanged"): self._on_properties_changed,
+            (self.NM_BUS_NAME, "StateChanged"): self._on_state_changed,
+            (self.NM_DEVICE_IFACE, "StateChanged"): self._on_state_changed,
+            (self.NM_ACTIVE_IFACE, "StateChanged"): self._on_active_state_changed,
+            (self.NM_BUS_NAME, "DeviceAdded"): self._on_device_added_or_removed,
+            (self.NM_BUS_NAME, "DeviceRemoved"): self._on_device_added_or_removed,
+            (self.NM_SETTINGS_IFACE, "NewConnection"): self._on_new_connection,
+            (self.NM_SETTINGS_IFACE, "ConnectionRemoved"): self._on_connection_removed,
+            (self.NM_SETTINGS_CONN_IFACE, "Updated"): self._on_connection_updated,
+            (self.DBUS_DAEMON_NAME, "NameOwnerChanged"): self._on_name_owner_changed,
+        }
         self.monitor = self
 
         print("[NM LOG] Starting NetworkManager thread")
@@ -54,153 +218,726 @@ class NetworkManager(QObject):
             print("[NM LOG] Connecting to system bus...")
             self._bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
             self._bus.add_message_handler(self._on_dbus_message)
+            await self._async_subscribe()
+            await self._async_check_nm_version()
+            await self._async_load_profiles()
             print("[NM LOG] Connected to DBus, doing initial scan...")
             await self._async_scan_networks()
-            await self._async_update_current_connection()
             print("[NM LOG] Initial network scan and connection update done")
         except Exception as e:
             print("[NM LOG] NetworkManager async init failed:", e)
 
+    def _static_node_for(self, path: str) -> intr.Node | None:
+        if not self._static_introspection:
+            return None
+        if path in _STATIC_NODES:
+            return _STATIC_NODES[path]
+        for prefix, node in _STATIC_PREFIX_NODES:
+            if path.startswith(prefix):
+                return node
+        return None
+
+    async def _get_proxy(self, path: str):
+        """Zwraca proxy obiektu NM dla ścieżki. Znane obiekty używają dołączonej
+        introspekcji, pozostałe są introspekowane raz, przy pierwszym użyciu."""
+        proxy = self._proxy_cache.get(path)
+        if proxy is None:
+            intro = self._static_node_for(path)
+            if intro is None:
+                async with self._dbus_slots:
+                    intro = await self._bus.introspect(self.NM_BUS_NAME, path)
+            proxy = self._bus.get_proxy_object(self.NM_BUS_NAME, path, intro)
+            self._proxy_cache[path] = proxy
+        return proxy
+
+    async def _async_check_nm_version(self):
+        """Dołączone XML opisują NM 1.x - dla innych wersji wracamy do introspekcji w locie."""
+        try:
+            version = str((await self._get_all(self.NM_PATH, self.NM_BUS_NAME)).get("Version", ""))
+        except Exception as e:
+            print("[NM LOG] Cannot read NetworkManager version:", e)
+            version = ""
+        if not version.startswith(self.NM_STATIC_INTROSPECTION_VERSION):
+            print(f"[NM LOG] Unknown NetworkManager version '{version}', using runtime introspection")
+            self._static_introspection = False
+            self._proxy_cache.clear()
+
+    def _evict_proxy(self, path: str):
+        if self._proxy_cache.pop(path, None) is not None:
+            print(f"[NM LOG] Evicted proxy for {path}")
+
+    async def _call_bus_daemon(self, member: str, signature: str = "", body=None):
+        reply = await self._bus.call(Message(
+            destination=self.DBUS_DAEMON_NAME,
+            path=self.DBUS_DAEMON_PATH,
+            interface=self.DBUS_DAEMON_NAME,
+            member=member,
+            signature=signature,
+            body=body or [],
+        ))
+        if reply.message_type == MessageType.ERROR:
+            raise RuntimeError(f"{member} failed: {reply.error_name} {reply.body}")
+        return reply.body
+
+    def _match_rules(self) -> List[str]:
+        """Reguły AddMatch: tylko sygnały NM z interfejsów i ścieżek, które śledzimy."""
+        nm = f"type='signal',sender='{self.NM_BUS_NAME}'"
+        props = f"{nm},interface='{self.DBUS_PROP_IFACE}',member='PropertiesChanged'"
+        return [
+            f"{nm},interface='{self.NM_BUS_NAME}',path='{self.NM_PATH}'",
+            f"{props},path='{self.NM_PATH}'",
+            f"{props},path_namespace='{self.NM_PATH}/AccessPoint'",
+            f"{props},path_namespace='{self.NM_PATH}/Devices'",
+            f"{props},path_namespace='{self.NM_ACTIVE_PREFIX.rstrip('/')}'",
+            f"{nm},interface='{self.NM_WIFI_IFACE}',path_namespace='{self.NM_PATH}/Devices'",
+            f"{nm},interface='{self.NM_DEVICE_IFACE}',member='StateChanged',path_namespace='{self.NM_PATH}/Devices'",
+            f"{nm},interface='{self.NM_ACTIVE_IFACE}',member='StateChanged',path_namespace='{self.NM_ACTIVE_PREFIX.rstrip('/')}'",
+            f"{nm},interface='{self.NM_SETTINGS_IFACE}',path='{self.NM_SETTINGS_PATH}'",
+            f"{nm},interface='{self.NM_SETTINGS_CONN_IFACE}',member='Updated',path_namespace='{self.NM_SETTINGS_PATH}'",
+            f"type='signal',sender='{self.DBUS_DAEMON_NAME}',interface='{self.DBUS_DAEMON_NAME}',"
+            f"member='NameOwnerChanged',arg0='{self.NM_BUS_NAME}'",
+        ]
+
+    async def _async_subscribe(self):
+        # Sygnały przychodzą od unikalnej nazwy (":1.x"), nie od "org.freedesktop.NetworkManager"
+        try:
+            self._nm_owner = (await self._call_bus_daemon("GetNameOwner", "s", [self.NM_BUS_NAME]))[0]
+        except Exception as e:
+            print("[NM LOG] NetworkManager is not on the bus:", e)
+        for rule in self._match_rules():
+            try:
+                await self._call_bus_daemon("AddMatch", "s", [rule])
+            except Exception as e:
+                print(f"[NM LOG] AddMatch failed for {rule}: {e}")
+
     def _on_dbus_message(self, msg):
         try:
-            if not msg or msg.sender != self.NM_BUS_NAME:
+            if msg.message_type != MessageType.SIGNAL:
+                return
+            if msg.sender != self._nm_owner and msg.sender != self.DBUS_DAEMON_NAME:
                 return
-            member = getattr(msg, "member", "")
-            print(f"[NM LOG] DBus message received: {member}")
-            if member in ("AccessPointAdded", "AccessPointRemoved", "PropertiesChanged", "StateChanged"):
-                print("[NM LOG] Scheduling scan and update due to signal")
-                asyncio.run_coroutine_threadsafe(self._async_scan_networks(), self._loop)
-                asyncio.run_coroutine_threadsafe(self._async_update_current_connection(), self._loop)
+            handler = self._signal_handlers.get((msg.interface, msg.member))
+            if handler is not None:
+                handler(msg)
         except Exception as e:
             print("[NM LOG] _on_dbus_message error:", e)
 
-    def scan_networks(self, timeout: float = 5.0) -> List[Dict[str, Any]]:
+    def _on_name_owner_changed(self, msg):
+        name, _old_owner, new_owner = msg.body
+        if name != self.NM_BUS_NAME:
+            return
+        print(f"[NM LOG] NetworkManager owner changed: {new_owner or '(gone)'}")
+        self._nm_owner = new_owner or None
+        # Nowa instancja NM - stare proxy i ścieżki obiektów są nieaktualne
+        self._proxy_cache.clear()
+        if new_owner:
+            self._queue_refresh("full")
+            asyncio.run_coroutine_threadsafe(self._async_load_profiles(), self._loop)
+
+    # --- PRZYROSTOWA AKTUALIZACJA WIDOKU Z SYGNAŁÓW ---
+
+    def _on_access_point_added(self, msg):
+        ap_path = msg.body[0]
+        device = self._devices.get(msg.path)
+        if device is not None and ap_path not in device.get("AccessPoints", []):
+            device["AccessPoints"] = list(device.get("AccessPoints", [])) + [ap_path]
+        asyncio.run_coroutine_threadsafe(self._async_add_access_point(ap_path, msg.path), self._loop)
+
+    async def _async_add_access_point(self, ap_path: str, dev_path: str):
+        try:
+            props = await self._get_all(ap_path, self.NM_AP_IFACE)
+            ap = self._access_points[ap_path] = AccessPoint.from_props(ap_path, props, dev_path)
+            self._record_strength(ap)
+            self._ap_generation += 1
+        except Exception as e:
+            print(f"[NM LOG] Cannot read AP {ap_path} props: {e}")
+            return
+        self._queue_refresh("networks")
+
+    def _on_access_point_removed(self, msg):
+        ap_path = msg.body[0]
+        device = self._devices.get(msg.path)
+        if device is not None:
+            device["AccessPoints"] = [p for p in device.get("AccessPoints", []) if p != ap_path]
+        self._evict_proxy(ap_path)
+        ap = self._access_points.pop(ap_path, None)
+        if ap is not None:
+            key = self._history_key(ap)
+            # NM mógł już dodać ten sam BSSID pod nową ścieżką - wtedy historia zostaje
+            if not any(self._history_key(other) == key for other in self._access_points.values()):
+                self._signal_history.pop(key, None)
+            self._ap_generation += 1
+            self._queue_refresh("networks")
+
+    def _on_properties_changed(self, msg):
+        iface, changed = msg.body[0], self._unwrap_props(msg.body[1])
+
+        if iface == self.NM_AP_IFACE:
+            ap = self._access_points.get(msg.path)
+            if ap is None:
+                return
+            # Surowa siła i LastSeen zmieniają się ciągle - publikujemy tylko, gdy ruszy się
+            # wygładzona wartość (z histerezą) albo coś innego
+            relevant = ap.update(changed) and not changed.keys() <= self._NOISY_AP_PROPS
+            if "Strength" in changed and self._record_strength(ap):
+                relevant = True
+                if ap is self._active_ap:
+                    self._emit_active_signal()
+            if relevant:
+                self._ap_generation += 1
+                self._queue_refresh("networks")
+        elif iface == self.NM_WIFI_IFACE:
+            device = self._devices.get(msg.path)
+            if device is not None:
+                device.update(changed)
+                if "AccessPoints" in changed:
+                    self._queue_refresh("networks")
+                if "LastScan" in changed:
+                    self._on_last_scan_changed(msg.path, changed["LastScan"])
+        elif iface == self.NM_ACTIVE_IFACE:
+            active = self._active_connections.get(msg.path)
+            if active is not None:
+                active.update(changed)
+            self._schedule_connection_update()
+        elif iface == self.NM_BUS_NAME and "ActiveConnections" in changed:
+            self._schedule_connection_update()
+
+    def _on_state_changed(self, msg):
+        # Zmiana stanu NM, urządzenia lub aktywnego połączenia - odśwież tylko bieżące połączenie
+        self._schedule_connection_update()
+
+    def _on_device_added_or_removed(self, msg):
+        if msg.member == "DeviceRemoved":
+            self._evict_proxy(msg.body[0])
+        print("[NM LOG] Device list changed, scheduling full resync")
+        self._queue_refresh("full")
+
+    _NOISY_AP_PROPS = frozenset(("Strength", "LastSeen"))
+
+    @staticmethod
+    def _history_key(ap: AccessPoint) -> tuple:
+        return ap.device, ap.bssid or ap.path
+
+    def _record_strength(self, ap: AccessPoint) -> bool:
+        """Dopisuje odczyt do historii BSSID na tym adapterze; True, jeśli zmieniła się wygładzona wartość."""
+        key = self._history_key(ap)
+        history = self._signal_history.get(key)
+        if history is None:
+            history = self._signal_history[key] = SignalHistory()
+        return history.push(ap.strength)
+
+    def _smoothed_strength(self, ap: AccessPoint) -> int:
+        history = self._signal_history.get(self._history_key(ap))
+        return history.stable if history is not None and history.stable is not None else ap.strength
+
+    def _emit_active_signal(self):
+        """Wysyła active_signal_changed, gdy zmieni się SSID lub wygładzona siła bieżącego AP."""
+        ssid = self.current_network or ""
+        strength = self._smoothed_strength(self._active_ap) if ssid and self._active_ap is not None else 0
+        if (ssid, strength) != self.active_signal:
+            self.active_signal = (ssid, strength)
+            self.active_signal_changed.emit(ssid, strength)
+
+    def _schedule_connection_update(self):
+        self._queue_refresh("connection")
+
+    @property
+    def networks(self):
+        return self.snapshot.networks
+
+    def _order_networks(self, networks) -> List[Dict[str, Any]]:
+        """Połączona sieć pierwsza, potem siła sygnału."""
+        current = self.current_network or ""
+        return sorted(
+            (dict(net, connected=net["ssid"] == current) for net in networks),
+            key=lambda net: (not net["connected"], -net.get("strength", 0)),
+        )
+
+    def _build_interfaces(self) -> Dict[str, InterfaceScan]:
+        interfaces = {}
+        for dev_path, device in self._wifi_devices():
+            name = self._interface_name(dev_path)
+            networks = self._order_networks(self._build_networks(dev_path))
+            interfaces[name] = InterfaceScan(name, dev_path, device.get("LastScan", -1), networks)
+        return interfaces
+
+    def _publish_networks(self, networks: List[Dict[str, Any]] | None = None) -> bool:
+        """Publikuje nowy snapshot: widok scalony i wyniki per interfejs.
+        Gdy sieci się nie zmieniły, wersja zostaje ta sama i sygnał nie jest wysyłany
+        (same znaczniki LastScan podmieniają snapshot bez nowej wersji)."""
+        if networks is None:
+            networks = self._build_networks()
+            interfaces = self._build_interfaces()
+        else:
+            interfaces = {}
+        ordered = self._order_networks(networks)
+
+        previous = self.snapshot
+        unchanged = (
+            previous.current == self.current_network
+            and list(previous.networks) == ordered
+            and previous.interfaces.keys() == interfaces.keys()
+            and all(previous.interfaces[name].networks == scan.networks for name, scan in interfaces.items())
+        )
+        if unchanged:
+            if any(previous.interfaces[name].last_scan != scan.last_scan for name, scan in interfaces.items()):
+                self.snapshot = NetworkSnapshot(previous.version, ordered, self.current_network, interfaces)
+            return False
+        self.snapshot = NetworkSnapshot(previous.version + 1, ordered, self.current_network, interfaces)
+        self.network_changed.emit(self.snapshot)
+        if self._bus and interfaces:
+            # Snapshot z prawdziwej tabeli AP (nie przykładowy) - sprawdź, czy łączyć automatycznie
+            self.auto_connect.evaluate()
+        return True
+
+    # --- HARMONOGRAM ODŚWIEŻANIA ---
+    # Zgłoszenia z jednego okna debounce łączą się w jedno odświeżenie. Naraz działa
+    # najwyżej jedno; zgłoszenie w trakcie trwania kolejkuje dokładnie jedno następne.
+
+    def _queue_refresh(self, *kinds: str):
+        """kinds: "networks" (tylko publikacja), "connection", "full" (pełny resync). Tylko z wątku pętli."""
+        self.refresh_stats["requested"] += 1
+        if self._refresh_pending:
+            self.refresh_stats["merged"] += 1
+        self._refresh_pending.update(kinds)
+        if self._refresh_task is None and self._refresh_handle is None:
+            self._refresh_handle = self._loop.call_later(self._refresh_window, self._start_refresh)
+
+    def _start_refresh(self):
+        self._refresh_handle = None
+        kinds, self._refresh_pending = self._refresh_pending, set()
+        waiters, self._refresh_waiters = self._refresh_waiters, []
+        self._refresh_task = self._loop.create_task(self._run_refresh(kinds, waiters))
+
+    async def _run_refresh(self, kinds, waiters):
+        self.refresh_stats["runs"] += 1
+        try:
+            if "full" in kinds:
+                await self._async_scan_networks()
+            else:
+                if "connection" in kinds:
+                    await self._async_update_current_connection()
+                if "networks" in kinds:
+                    self._publish_networks()
+        except Exception as e:
+            print("[NM LOG] refresh error:", e)
+        finally:
+            self._refresh_task = None
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(self.snapshot)
+            if self._refresh_pending:
+                self._refresh_handle = self._loop.call_later(self._refresh_window, self._start_refresh)
+
+    async def _async_refresh(self, *kinds: str):
+        """Zgłasza odświeżenie i czeka, aż obejmujące je odświeżenie się zakończy."""
+        waiter = self._loop.create_future()
+        self._refresh_waiters.append(waiter)
+        self._queue_refresh(*kinds)
+        return await waiter
+
+    # --- AKTYWNE SKANOWANIE (RequestScan + LastScan) ---
+
+    def _wifi_devices(self):
+        return [(p, d) for p, d in self._devices.items() if d.get("DeviceType") == self.NM_DEVICE_TYPE_WIFI]
+
+    def _interface_name(self, dev_path: str | None) -> str:
+        device = self._devices.get(dev_path, {})
+        return device.get("Interface") or dev_path or ""
+
+    def _device_for_interface(self, interface: str) -> str | None:
+        for dev_path, _device in self._wifi_devices():
+            if self._interface_name(dev_path) == interface:
+                return dev_path
+        return None
+
+    async def _async_active_scan(self, dev_paths: List[str] | None = None):
+        """Prosi urządzenia Wi-Fi (domyślnie wszystkie) o skan radiowy - równolegle - i czeka na nowe wyniki."""
+        if dev_paths is None:
+            dev_paths = [p for p, _d in self._wifi_devices()]
+        await asyncio.gather(*(self._async_request_scan(p) for p in dev_paths), return_exceptions=True)
+        return await self._async_refresh("full")
+
+    async def _async_scan(self, active: bool = False, interface: str | None = None):
+        dev_paths = None
+        if interface is not None:
+            dev_path = self._device_for_interface(interface)
+            if dev_path is None:
+                print(f"[NM LOG] No Wi-Fi device with interface {interface}")
+                return self._scan_result(interface)
+            dev_paths = [dev_path]
+        if active:
+            await self._async_active_scan(dev_paths)
+        else:
+            # Tabelę AP aktualizują sygnały NM - wystarczy ją opublikować, bez GetManagedObjects
+            await self._async_refresh("networks")
+        return self._scan_result(interface)
+
+    def _scan_result(self, interface: str | None):
+        if interface is None:
+            return self.snapshot
+        return self.snapshot.interfaces.get(interface) or InterfaceScan(interface, None, -1, ())
+
+    async def _async_request_scan(self, dev_path: str):
+        # Skan już trwa (nasz lub cudzy) - czekamy na ten sam wynik zamiast prosić ponownie
+        pending = self._scan_waiters.get(dev_path)
+        if pending is not None:
+            await asyncio.shield(pending[1])
+            return
+
+        now = time.monotonic()
+        if now - self._scan_requested_at.get(dev_path, float("-inf")) < self.MIN_SCAN_REQUEST_INTERVAL:
+            print(f"[NM LOG] Scan on {dev_path} requested recently, reusing last results")
+            return
+        self._scan_requested_at[dev_path] = now
+
+        previous = self._devices.get(dev_path, {}).get("LastScan", -1)
+        waiter = self._loop.create_future()
+        self._scan_waiters[dev_path] = (previous, waiter)
+        try:
+            try:
+                wifi = (await self._get_proxy(dev_path)).get_interface(self.NM_WIFI_IFACE)
+                async with self._dbus_slots:
+                    await wifi.call_request_scan({})
+            except DBusError as e:
+                if e.type != self.NM_ERROR_NOT_ALLOWED:
+                    raise
+                # NM już skanuje albo odrzucił zapytanie przez własny limit - LastScan i tak się zmieni
+                print(f"[NM LOG] RequestScan on {dev_path} not allowed ({e.text}), waiting for running scan")
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.SCAN_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"[NM LOG] Scan on {dev_path} did not finish in {self.SCAN_TIMEOUT}s")
+        except Exception as e:
+            print(f"[NM LOG] RequestScan on {dev_path} failed: {e}")
+        finally:
+            self._scan_waiters.pop(dev_path, None)
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _on_last_scan_changed(self, dev_path: str, last_scan: int):
+        pending = self._scan_waiters.get(dev_path)
+        if pending is not None and last_scan > pending[0] and not pending[1].done():
+            pending[1].set_result(last_scan)
+
+    def scan_networks(self, timeout: float = 5.0, active: bool = False,
+                      interface: str | None = None) -> NetworkSnapshot | InterfaceScan:
+        """Blokująco zwraca listę sieci (nie wołać z wątku GUI - tam start_scan).
+        active=True wymusza skan radiowy (RequestScan) zamiast odczytu listy AP, którą NM już ma.
+        Z interface="wlan1" skanuje tylko ten adapter i zwraca jego InterfaceScan
+        zamiast scalonego snapshotu (per adapter są też w snapshot.interfaces)."""
         print("[NM LOG] scan_networks called")
         if not self._bus:
             print("[NM LOG] DBus not ready, returning sample networks")
-            return list(_SAMPLE_NETWORKS)
-        fut = asyncio.run_coroutine_threadsafe(self._async_scan_networks(), self._loop)
+            if interface is not None:
+                return InterfaceScan(interface, None, -1, ())
+            return NetworkSnapshot(0, _SAMPLE_NETWORKS, self.current_network)
+        fut = asyncio.run_coroutine_threadsafe(self._async_scan(active, interface), self._loop)
         try:
             fut.result(timeout=timeout)
         except Exception as e:
             print("[NM LOG] scan_networks: async scan failed or timed out:", e)
-        return list(self.networks) if self.networks else list(_SAMPLE_NETWORKS)
+        if interface is None and not self.snapshot.networks:
+            return NetworkSnapshot(0, _SAMPLE_NETWORKS, self.current_network)
+        return self._scan_result(interface)
 
     def connect_to_network(self, ssid: str, password: str | None = None, timeout: float = 30.0) -> bool:
+        """Blokujące łączenie (nie wołać z wątku GUI - tam start_connect)."""
         print(f"[NM LOG] connect_to_network called for SSID: {ssid}")
         if not self._bus:
             print("[NM LOG] DBus not available, simulating connection (mock)")
             self.current_network = ssid
             self.connection_changed.emit(ssid or "")
+            self._emit_mock_signal(ssid)
             return True
-        fut = asyncio.run_coroutine_threadsafe(self._async_connect(ssid, password), self._loop)
+        fut = asyncio.run_coroutine_threadsafe(self._async_user_connect(ssid, password, timeout), self._loop)
         try:
-            success = bool(fut.result(timeout=timeout))
+            success = fut.result(timeout=timeout + 1.0).success
             print(f"[NM LOG] connect_to_network result: {success}")
             return success
         except Exception as e:
             print("[NM LOG] connect_to_network error:", e)
             return False
 
-    async def _async_scan_networks(self):
-        print("[NM LOG] _async_scan_networks started")
+    # --- NIEBLOKUJĄCE API DLA UI ---
+    # Zwracają concurrent.futures.Future od razu; praca dzieje się na pętli asyncio,
+    # a wynik przychodzi także sygnałem Qt (scan_finished / connect_finished).
+
+    def start_scan(self, active: bool = False, interface: str | None = None) -> Future:
+        if not self._bus:
+            self._publish_networks(_SAMPLE_NETWORKS)
+            self.scan_finished.emit(self.snapshot)
+            return self._done_future(self._scan_result(interface))
+        coro = self._async_scan(active, interface)
+        return asyncio.run_coroutine_threadsafe(self._async_report_scan(coro), self._loop)
+
+    def start_connect(self, ssid: str, password: str | None = None) -> Future:
+        print(f"[NM LOG] start_connect called for SSID: {ssid}")
+        if not self._bus:
+            print("[NM LOG] DBus not available, simulating connection (mock)")
+            self.current_network = ssid
+            self.connection_changed.emit(ssid or "")
+            self._emit_mock_signal(ssid)
+            result = ConnectResult(ssid, True, self.NM_ACTIVE_STATE_ACTIVATED, self.NM_ACTIVE_REASON_NONE)
+            self.connect_finished.emit(result)
+            return self._done_future(result)
+        return asyncio.run_coroutine_threadsafe(self._async_report_connect(ssid, password), self._loop)
+
+    async def _async_report_scan(self, coro):
+        result = await coro
+        self.scan_finished.emit(self.snapshot)
+        return result
+
+    async def _async_report_connect(self, ssid: str, password: str | None):
+        result = await self._async_user_connect(ssid, password)
+        print(f"[NM LOG] connect result for {ssid}: {result.success} ({result.reason_text})")
+        self.connect_finished.emit(result)
+        return result
+
+    def _emit_mock_signal(self, ssid: str):
+        strength = next((net["strength"] for net in _SAMPLE_NETWORKS if net["ssid"] == ssid), 0)
+        self.active_signal = (ssid or "", strength)
+        self.active_signal_changed.emit(*self.active_signal)
+
+    @staticmethod
+    def _done_future(result) -> Future:
+        fut = Future()
+        fut.set_result(result)
+        return fut
+
+    @staticmethod
+    def _unwrap_props(raw: Dict[str, Any]) -> Dict[str, Any]:
+        return {name: (value.value if isinstance(value, Variant) else value) for name, value in raw.items()}
+
+    async def _get_all(self, path: str, iface: str) -> Dict[str, Any]:
+        """Pobiera wszystkie właściwości interfejsu jednym wywołaniem Properties.GetAll."""
+        proxy = await self._get_proxy(path)
+        props = proxy.get_interface(self.DBUS_PROP_IFACE)
+        async with self._dbus_slots:
+            raw = await props.call_get_all(iface)
+        return self._unwrap_props(raw)
+
+    def _network_view(self, ap: AccessPoint, ssid: str, ranking: List[BssidScore]) -> Dict[str, Any]:
+        """Rekord sieci (poziom SSID) dla UI, wyprowadzony z najlepiej ocenionego BSSID.
+        "ranking" to wszystkie BSSID tej sieci od najlepszego (BssidScore)."""
+        return {
+            "ssid": ssid,
+            "strength": self._smoothed_strength(ap),
+            "frequency": ap.frequency,
+            "band": ap.band,
+            "bssid": ap.bssid,
+            "secured": ap.secured,
+            "interface": self._interface_name(ap.device),
+            "score": ranking[0].score,
+            "ranking": tuple(ranking),
+        }
+
+    # --- WIDOK OBIEKTÓW NM (urządzenia, AP, aktywne połączenia) ---
+
+    async def _async_resync(self):
+        """Odbudowuje cały widok NM: jedno GetManagedObjects, a gdy ObjectManager
+        jest niedostępny - przejście po obiektach jak wcześniej."""
         try:
-            if not self._bus:
-                raise RuntimeError("DBus MessageBus not available")
+            await self._async_load_managed_objects()
+        except Exception as e:
+            print("[NM LOG] ObjectManager unavailable, falling back to per-object walk:", e)
+            await self._async_walk_objects()
 
-            nm_intro = await self._bus.introspect(self.NM_BUS_NAME, self.NM_PATH)
-            nm_obj = self._bus.get_proxy_object(self.NM_BUS_NAME, self.NM_PATH, nm_intro)
-            nm_iface = nm_obj.get_interface(self.NM_BUS_NAME)
-            nm_props = nm_obj.get_interface(self.DBUS_PROP_IFACE)
+        live = set(self._devices) | set(self._access_points) | set(self._active_connections) | set(self._profile_ssids)
+        live.add(self.NM_SETTINGS_PATH)
+        for path in [p for p in self._proxy_cache if p.startswith(self.NM_PATH + "/") and p not in live]:
+            self._evict_proxy(path)
 
-            try:
-                devices = await nm_iface.call_get_devices()
-            except Exception:
-                try:
-                    devices_variant = await nm_props.call_get(self.NM_BUS_NAME, "Devices")
-                    devices = devices_variant.value if hasattr(devices_variant, "value") else devices_variant
-                except Exception:
-                    devices = []
+    async def _async_load_managed_objects(self):
+        proxy = await self._get_proxy(self.NM_OBJECT_MANAGER_PATH)
+        object_manager = proxy.get_interface(self.DBUS_OBJECT_MANAGER_IFACE)
+        objects = await object_manager.call_get_managed_objects()
 
-            print(f"[NM LOG] Devices: {devices}")
-            networks: List[Dict[str, Any]] = []
+        devices, ap_props, active_connections = {}, {}, {}
+        for path, ifaces in objects.items():
+            if self.NM_AP_IFACE in ifaces:
+                ap_props[path] = self._unwrap_props(ifaces[self.NM_AP_IFACE])
+            elif self.NM_DEVICE_IFACE in ifaces:
+                device = self._unwrap_props(ifaces[self.NM_DEVICE_IFACE])
+                device.update(self._unwrap_props(ifaces.get(self.NM_WIFI_IFACE, {})))
+                devices[path] = device
+            elif self.NM_ACTIVE_IFACE in ifaces:
+                active_connections[path] = self._unwrap_props(ifaces[self.NM_ACTIVE_IFACE])
 
-            for dev_path in devices:
-                try:
-                    dev_intro = await self._bus.introspect(self.NM_BUS_NAME, dev_path)
-                    dev_obj = self._bus.get_proxy_object(self.NM_BUS_NAME, dev_path, dev_intro)
-                    dev_props = dev_obj.get_interface(self.DBUS_PROP_IFACE)
-                except Exception as e:
-                    print(f"[NM LOG] Cannot introspect device {dev_path}: {e}")
-                    continue
+        self._devices = devices
+        self._reconcile_access_points(ap_props)
+        self._active_connections = active_connections
+        print(f"[NM LOG] Managed objects: {len(devices)} devices, {len(ap_props)} APs, "
+              f"{len(active_connections)} active connections")
+
+    async def _async_walk_objects(self):
+        """Fallback: odczyt widoku obiekt po obiekcie (GetAll na każdym, równolegle)."""
+        try:
+            root = await self._get_all(self.NM_PATH, self.NM_BUS_NAME)
+        except Exception:
+            root = {}
+
+        dev_paths = root.get("Devices", [])
+        results = await asyncio.gather(*(self._async_read_device(p) for p in dev_paths), return_exceptions=True)
+
+        devices, ap_props = {}, {}
+        for dev_path, result in zip(dev_paths, results):
+            if isinstance(result, Exception):
+                print(f"[NM LOG] Cannot read DeviceType for {dev_path}: {result}")
+                continue
+            device, device_aps = result
+            devices[dev_path] = device
+            ap_props.update(device_aps)
 
+        self._devices = devices
+        self._reconcile_access_points(ap_props)
+        self._active_connections = await self._async_read_active_connections(root.get("ActiveConnections", []))
+
+    async def _async_read_device(self, dev_path: str):
+        device = await self._get_all(dev_path, self.NM_DEVICE_IFACE)
+        if device.get("DeviceType") != self.NM_DEVICE_TYPE_WIFI:
+            return device, {}
+
+        try:
+            device.update(await self._get_all(dev_path, self.NM_WIFI_IFACE))
+        except Exception:
+            device["AccessPoints"] = []
+
+        ap_paths = device.get("AccessPoints", [])
+        results = await asyncio.gather(*(self._get_all(p, self.NM_AP_IFACE) for p in ap_paths), return_exceptions=True)
+        access_points = {}
+        for ap_path, result in zip(ap_paths, results):
+            if isinstance(result, Exception):
+                print(f"[NM LOG] Cannot read AP {ap_path} props: {result}")
+                continue
+            access_points[ap_path] = result
+        return device, access_points
+
+    async def _async_read_active_connections(self, active) -> Dict[str, Dict[str, Any]]:
+        results = await asyncio.gather(*(self._get_all(p, self.NM_ACTIVE_IFACE) for p in active), return_exceptions=True)
+        active_connections = {}
+        for ac_path, result in zip(active, results):
+            if isinstance(result, Exception):
+                print(f"[NM LOG] Error checking active connection {ac_path}: {result}")
+                continue
+            active_connections[ac_path] = result
+        return active_connections
+
+    def _reconcile_access_points(self, ap_props: Dict[str, Dict[str, Any]]):
+        """Nowa tabela AP po resyncu; rekordy, które już znamy, są aktualizowane w miejscu."""
+        owners = {}
+        for dev_path, device in self._devices.items():
+            for ap_path in device.get("AccessPoints", []):
+                owners[ap_path] = dev_path
+
+        previous = self._access_points
+        table = {}
+        for path, props in ap_props.items():
+            ap = previous.get(path)
+            if ap is None:
+                ap = AccessPoint(path)
+            ap.device = owners.get(path)
+            ap.update(props)
+            self._record_strength(ap)
+            table[path] = ap
+        self._access_points = table
+        self._ap_generation += 1
+        live = {self._history_key(ap) for ap in table.values()}
+        for key in [k for k in self._signal_history if k not in live]:
+            del self._signal_history[key]
+
+    def _channel_report(self) -> ChannelReport:
+        """Analiza kanałów dla bieżącej tabeli AP; przeliczana tylko po zmianie tabeli.
+        Ostatni wynik jest też w `self.channels` (niezmienny, można czytać z wątku Qt)."""
+        if self.channels.generation != self._ap_generation:
+            self.channels = analyze_channels(self._access_points.values(), self._smoothed_strength, self._ap_generation)
+        return self.channels
+
+    def _congestion(self, ap: AccessPoint) -> float:
+        return self._channel_report().interference(ap.path)
+
+    def _bssid_ranking(self, ssid: str, device: str | None = None) -> List[BssidScore]:
+        """BSSID danej sieci od najlepszego: pasmo, wygładzony sygnał i zatłoczenie kanału.
+        Tylko z wątku pętli (czyta żywą tabelę AP) - UI dostaje ranking w snapshot ("ranking")."""
+        candidates = [ap for ap in self._access_points.values()
+                      if ap.ssid == ssid.encode() and (device is None or ap.device == device)]
+        return rank_bssids(candidates, self._congestion, self._smoothed_strength)
+
+    def _build_networks(self, device: str | None = None) -> List[Dict[str, Any]]:
+        """Lista sieci z tabeli AP (wszystkich albo jednego urządzenia): dla każdego SSID najlepiej
+        oceniony BSSID, nie najsilniejszy (kolejność i "connected" nadaje _publish_networks)."""
+        groups: Dict[bytes, List[AccessPoint]] = {}
+        for ap in self._access_points.values():
+            if not ap.ssid:
+                continue  # ukryte sieci
+            if device is not None and ap.device != device:
+                continue
+            groups.setdefault(ap.ssid, []).append(ap)
+
+        networks = []
+        for aps in groups.values():
+            ranking = rank_bssids(aps, self._congestion, self._smoothed_strength)
+            best = self._access_points[ranking[0].path]
+            networks.append(self._network_view(best, best.ssid_text, ranking))
+        return networks
+
+    async def _async_current_ssid(self) -> str | None:
+        """SSID bieżącego połączenia Wi-Fi na podstawie aktywnych połączeń z widoku."""
+        current_ssid = None
+        active_ap = None
+        for ac in self._active_connections.values():
+            con_type = ac.get("Type")
+
+            # SpecificObject wskazuje na konkretny AP (router) - stamtąd bierzemy prawdziwy SSID
+            spec_obj_path = ac.get("SpecificObject")
+            found_real_ssid = False
+
+            if spec_obj_path and spec_obj_path != "/":
                 try:
-                    dtype_variant = await dev_props.call_get(self.NM_DEVICE_IFACE, "DeviceType")
-                    dtype = dtype_variant.value if hasattr(dtype_variant, "value") else dtype_variant
+                    ap = self._access_points.get(spec_obj_path)
+                    if ap is None:
+                        ap = AccessPoint.from_props(spec_obj_path, await self._get_all(spec_obj_path, self.NM_AP_IFACE))
+                    current_ssid = ap.ssid_text
+                    active_ap = ap
+                    found_real_ssid = True
                 except Exception as e:
-                    print(f"[NM LOG] Cannot read DeviceType for {dev_path}: {e}")
-                    dtype = None
+                    print(f"[NM LOG] Failed to get SSID from AP: {e}")
 
-                if dtype != 2:
-                    print(f"[NM LOG] Device {dev_path} type is {dtype}, skipping (not WiFi)")
-                    continue
+            # Jeśli nie udało się pobrać SSID (lub to nie Wi-Fi), użyj nazwy profilu (Id) jako fallback
+            if not found_real_ssid:
+                current_ssid = str(ac.get("Id", ""))
 
-                try:
-                    wifi_iface = dev_obj.get_interface(self.NM_WIFI_IFACE)
-                    aps = await wifi_iface.call_get_access_points()
-                except Exception:
-                    try:
-                        aps_variant = await dev_props.call_get(self.NM_WIFI_IFACE, "AccessPoints")
-                        aps = aps_variant.value if hasattr(aps_variant, "value") else aps_variant
-                    except Exception:
-                        aps = []
-
-                print(f"[NM LOG] AccessPoints for {dev_path}: {aps}")
-
-                for ap_path in aps:
-                    try:
-                        ap_intro = await self._bus.introspect(self.NM_BUS_NAME, ap_path)
-                        ap_obj = self._bus.get_proxy_object(self.NM_BUS_NAME, ap_path, ap_intro)
-                        ap_props = ap_obj.get_interface(self.DBUS_PROP_IFACE)
-                        ssid_variant = await ap_props.call_get(self.NM_AP_IFACE, "Ssid")
-                        strength_variant = await ap_props.call_get(self.NM_AP_IFACE, "Strength")
-                        freq_variant = await ap_props.call_get(self.NM_AP_IFACE, "Frequency")
-                        ssid_raw = ssid_variant.value if hasattr(ssid_variant, "value") else ssid_variant
-                        strength_raw = strength_variant.value if hasattr(strength_variant, "value") else strength_variant
-                        freq_raw = freq_variant.value if hasattr(freq_variant, "value") else freq_variant
-
-                        ssid = bytes(ssid_raw).decode("utf-8", errors="ignore") if isinstance(ssid_raw, (list, tuple, bytes, bytearray)) else str(ssid_raw)
-                        strength = int(strength_raw)
-                        freq = int(freq_raw)
-                        connected = ssid == (self.current_network or "")
-                        secured = True
-                        try:
-                            wpa_flags = (await ap_props.call_get(self.NM_AP_IFACE, "WpaFlags")).value
-                            rsn_flags = (await ap_props.call_get(self.NM_AP_IFACE, "RsnFlags")).value
-                            flags = (await ap_props.call_get(self.NM_AP_IFACE, "Flags")).value
-                            if not wpa_flags and not rsn_flags and flags == 0:
-                                secured = False
-                        except Exception:
-                            pass
-                        networks.append({"ssid": ssid, "strength": strength, "frequency": freq, "secured": secured, "connected": connected})
-                    except Exception as e:
-                        print(f"[NM LOG] Cannot read AP {ap_path} props: {e}")
-                        continue
-
-            dedup = {}
-            for n in sorted(networks, key=lambda x: x["strength"], reverse=True):
-                if n["ssid"] not in dedup or n["strength"] > dedup[n["ssid"]]["strength"]:
-                    dedup[n["ssid"]] = n
-            self.networks = list(dedup.values())
+            # Jeśli znaleźliśmy cokolwiek i to jest typ wireless, przerywamy szukanie
+            if con_type == "802-11-wireless" or found_real_ssid:
+                break
+        self._active_ap = active_ap
+        return current_ssid
+
+    def _set_current_network(self, ssid: str | None) -> bool:
+        previous = self.current_network
+        self.current_network = ssid
+        if previous != self.current_network:
+            print(f"[NM LOG] Connection changed: {self.current_network}")
+            self.connection_changed.emit(self.current_network or "")
+            return True
+        return False
+
+    async def _async_scan_networks(self):
+        print("[NM LOG] _async_scan_networks started")
+        try:
+            if not self._bus:
+                raise RuntimeError("DBus MessageBus not available")
+
+            await self._async_resync()
+            self._set_current_network(await self._async_current_ssid())
+            self._publish_networks()
+            self._emit_active_signal()
             print(f"[NM LOG] Networks found: {[n['ssid'] for n in self.networks]}")
-            self.network_changed.emit(self.networks)
-            return self.networks
+            return self.snapshot
         except Exception as e:
             print("[NM LOG] async_scan_networks error:", e)
-            if not self.networks:
-                self.networks = list(_SAMPLE_NETWORKS)
-                self.network_changed.emit(self.networks)
-            return self.networks
+            if not self.snapshot.networks:
+                self._publish_networks(_SAMPLE_NETWORKS)
+            return self.snapshot
 
     async def _async_update_current_connection(self):
         print("[NM LOG] _async_update_current_connection started")
@@ -208,119 +945,234 @@ class NetworkManager(QObject):
             if not self._bus:
                 raise RuntimeError("DBus MessageBus not available")
 
-            nm_intro = await self._bus.introspect(self.NM_BUS_NAME, self.NM_PATH)
-            nm_obj = self._bus.get_proxy_object(self.NM_BUS_NAME, self.NM_PATH, nm_intro)
-            nm_props = nm_obj.get_interface(self.DBUS_PROP_IFACE)
-
             # Pobierz listę aktywnych połączeń
             try:
-                active_variant = await nm_props.call_get(self.NM_BUS_NAME, "ActiveConnections")
-                active = active_variant.value if hasattr(active_variant, "value") else active_variant
+                active = (await self._get_all(self.NM_PATH, self.NM_BUS_NAME)).get("ActiveConnections", [])
             except Exception:
                 active = []
 
-            current_ssid = None
-            
-            # Przeszukaj aktywne połączenia
-            for ac_path in active:
-                try:
-                    ac_intro = await self._bus.introspect(self.NM_BUS_NAME, ac_path)
-                    ac_obj = self._bus.get_proxy_object(self.NM_BUS_NAME, ac_path, ac_intro)
-                    ac_props = ac_obj.get_interface(self.DBUS_PROP_IFACE)
-                    
-                    # 1. Sprawdź typ połączenia (chcemy Wireless - '802-11-wireless')
-                    type_variant = await ac_props.call_get(self.NM_ACTIVE_IFACE, "Type")
-                    con_type = type_variant.value if hasattr(type_variant, "value") else type_variant
-                    
-                    # 2. Spróbuj pobrać SSID z obiektu AccessPoint (SpecificObject)
-                    # To jest kluczowe! SpecificObject wskazuje na konkretny AP (router)
-                    spec_obj_variant = await ac_props.call_get(self.NM_ACTIVE_IFACE, "SpecificObject")
-                    spec_obj_path = spec_obj_variant.value if hasattr(spec_obj_variant, "value") else spec_obj_variant
-                    
-                    found_real_ssid = False
-                    
-                    if spec_obj_path and spec_obj_path != "/":
-                        try:
-                            # Introspekcja AccessPointa
-                            ap_intro = await self._bus.introspect(self.NM_BUS_NAME, spec_obj_path)
-                            ap_obj = self._bus.get_proxy_object(self.NM_BUS_NAME, spec_obj_path, ap_intro)
-                            ap_props = ap_obj.get_interface(self.DBUS_PROP_IFACE)
-                            
-                            ssid_variant = await ap_props.call_get(self.NM_AP_IFACE, "Ssid")
-                            ssid_raw = ssid_variant.value if hasattr(ssid_variant, "value") else ssid_variant
-                            
-                            # Dekodowanie SSID
-                            if isinstance(ssid_raw, (list, tuple, bytes, bytearray)):
-                                current_ssid = bytes(ssid_raw).decode("utf-8", errors="ignore")
-                            else:
-                                current_ssid = str(ssid_raw)
-                                
-                            found_real_ssid = True
-                        except Exception as e:
-                            print(f"[NM LOG] Failed to get SSID from AP: {e}")
-
-                    # 3. Jeśli nie udało się pobrać SSID (lub to nie Wi-Fi), użyj nazwy profilu (Id) jako fallback
-                    if not found_real_ssid:
-                        cid_variant = await ac_props.call_get(self.NM_ACTIVE_IFACE, "Id")
-                        cid = cid_variant.value if hasattr(cid_variant, "value") else cid_variant
-                        # Jeśli to Wi-Fi, ale nie mamy SSID, to prawdopodobnie "Wi-Fi connection 1"
-                        # Wtedy spróbujemy to nadpisać jeśli con_type == wireless w przyszłości
-                        current_ssid = str(cid)
-
-                    # Jeśli znaleźliśmy cokolwiek i to jest typ wireless, przerywamy szukanie
-                    if con_type == "802-11-wireless" or found_real_ssid:
-                        break
+            # Aktywne połączenia nie mają sygnału "Removed" - usuń z cache te, których NM już nie zgłasza
+            for path in [p for p in self._proxy_cache if p.startswith(self.NM_ACTIVE_PREFIX) and p not in active]:
+                self._evict_proxy(path)
 
-                except Exception as e:
-                    print(f"[NM LOG] Error checking active connection {ac_path}: {e}")
-                    continue
-
-            previous = self.current_network
-            self.current_network = current_ssid
-            
-            if previous != self.current_network:
-                print(f"[NM LOG] Connection changed: {self.current_network}")
-                self.connection_changed.emit(self.current_network or "")
-            
+            self._active_connections = await self._async_read_active_connections(active)
+            if self._set_current_network(await self._async_current_ssid()):
+                # Flaga "connected" w rekordach sieci zależy od bieżącego SSID
+                self._publish_networks()
+            self._emit_active_signal()
             return self.current_network
 
         except Exception as e:
             print("[NM LOG] async_update_current_connection error:", e)
             return None
 
-    async def _async_connect(self, ssid: str, password: str | None = None) -> bool:
-        print(f"[NM LOG] _async_connect called for SSID: {ssid}")
+    # --- INDEKS ZAPISANYCH PROFILI NM (SSID -> Settings.Connection) ---
+
+    async def _async_load_profiles(self):
         try:
-            nm_intro = await self._bus.introspect(self.NM_BUS_NAME, self.NM_PATH)
-            nm_obj = self._bus.get_proxy_object(self.NM_BUS_NAME, self.NM_PATH, nm_intro)
-            nm_iface = nm_obj.get_interface(self.NM_BUS_NAME)
-            settings = {
-                "connection": {"id": ssid, "type": "802-11-wireless"},
-                "802-11-wireless": {"ssid": Variant("ay", ssid.encode()), "mode": "infrastructure"},
-                "ipv4": {"method": "auto"},
-                "ipv6": {"method": "ignore"}
-            }
-            if password:
-                settings["802-11-wireless-security"] = {"key-mgmt": "wpa-psk", "psk": password}
-            try:
-                await nm_iface.call_add_and_activate_connection(settings, "/", "/")
-            except Exception:
+            settings = (await self._get_proxy(self.NM_SETTINGS_PATH)).get_interface(self.NM_SETTINGS_IFACE)
+            async with self._dbus_slots:
+                paths = await settings.call_list_connections()
+        except Exception as e:
+            print("[NM LOG] Cannot list saved connections:", e)
+            return
+        self._profiles.clear()
+        self._profile_ssids.clear()
+        await asyncio.gather(*(self._async_index_profile(p) for p in paths), return_exceptions=True)
+        print(f"[NM LOG] Indexed {len(self._profiles)} saved Wi-Fi profiles")
+
+    async def _async_index_profile(self, path: str):
+        try:
+            conn = (await self._get_proxy(path)).get_interface(self.NM_SETTINGS_CONN_IFACE)
+            async with self._dbus_slots:
+                settings = await conn.call_get_settings()
+        except Exception as e:
+            print(f"[NM LOG] Cannot read saved connection {path}: {e}")
+            return
+        self._drop_profile(path)
+        wireless = settings.get("802-11-wireless", {})
+        if "ssid" not in wireless:
+            return
+        ssid = bytes(wireless["ssid"].value)
+        self._profiles.setdefault(ssid, path)
+        self._profile_ssids[path] = ssid
+
+    def _drop_profile(self, path: str):
+        ssid = self._profile_ssids.pop(path, None)
+        if ssid is not None and self._profiles.get(ssid) == path:
+            del self._profiles[ssid]
+            # Inny profil z tym samym SSID przejmuje wpis
+            for other_path, other_ssid in self._profile_ssids.items():
+                if other_ssid == ssid:
+                    self._profiles[ssid] = other_path
+                    break
+
+    def _on_new_connection(self, msg):
+        asyncio.run_coroutine_threadsafe(self._async_index_profile(msg.body[0]), self._loop)
+
+    def _on_connection_removed(self, msg):
+        self._drop_profile(msg.body[0])
+        self._evict_proxy(msg.body[0])
+
+    def _on_connection_updated(self, msg):
+        asyncio.run_coroutine_threadsafe(self._async_index_profile(msg.path), self._loop)
+
+    async def _async_set_profile_psk(self, path: str, password: str, force: bool = False) -> bool:
+        """Nadpisuje hasło WPA-PSK w istniejącym profilu (np. po zmianie hasła sieci).
+
+        Profil systemowy zapisujemy tylko, gdy hasło faktycznie się różni (GetSecrets), albo
+        z force=True - po porażce "no secrets", gdy porównać się nie dało. Błąd (np. odmowa
+        polkit) nie przerywa łączenia: zwraca False, a aktywacja idzie z tym, co NM już ma.
+        """
+        try:
+            conn = (await self._get_proxy(path)).get_interface(self.NM_SETTINGS_CONN_IFACE)
+            async with self._dbus_slots:
+                settings = await conn.call_get_settings()
+            security = settings.get("802-11-wireless-security")
+            if security is not None and security.get("key-mgmt", Variant("s", "")).value != "wpa-psk":
+                return False  # np. WPA-Enterprise - nie ruszamy
+            if security is None:
+                security = settings["802-11-wireless-security"] = {"key-mgmt": Variant("s", "wpa-psk")}
+            elif not force:
                 try:
-                    await nm_iface.call_activate_connection(settings, "/", "/")
-                except Exception:
-                    pass
-            await asyncio.sleep(1.0)
-            await self._async_update_current_connection()
-            return self.current_network == ssid
+                    async with self._dbus_slots:
+                        secrets = await conn.call_get_secrets("802-11-wireless-security")
+                except DBusError:
+                    return False  # nie wiemy, czy hasło się zmieniło - zaktualizujemy dopiero po "no secrets"
+                stored = secrets.get("802-11-wireless-security", {}).get("psk")
+                if stored is None or stored.value == password:
+                    return False
+            security["psk"] = Variant("s", password)
+            async with self._dbus_slots:
+                await conn.call_update(settings)
+            print(f"[NM LOG] Updated password in saved profile {path}")
+            return True
         except Exception as e:
-            print("[NM LOG] async_connect error:", e)
+            print(f"[NM LOG] Cannot update password in saved profile {path}: {e}")
             return False
 
+    def _wifi_device_for(self, ssid: str):
+        """(urządzenie, AP) do aktywacji: najlepiej oceniony BSSID z tym SSID i jego urządzenie.
+
+        AP idzie wyłącznie jako `specific_object` - wybiera BSSID tylko dla tej jednej aktywacji.
+        Nie zapisujemy go w profilu (802-11-wireless.bssid), bo NM używałby profilu już tylko
+        z tym jednym AP i nie dałoby się połączyć z tą siecią przez inny punkt dostępowy.
+        """
+        ranking = [score for score in self._bssid_ranking(ssid) if score.device]
+        if ranking:
+            return ranking[0].device, ranking[0].path
+        wifi_devices = self._wifi_devices()
+        return (wifi_devices[0][0] if wifi_devices else "/"), "/"
+
+    def request_auto_connect(self):
+        """Ponowne sprawdzenie auto-connect (np. po włączeniu opcji w ustawieniach); bezpieczne z wątku GUI."""
+        if self._bus:
+            self._loop.call_soon_threadsafe(self.auto_connect.evaluate)
+
+    async def _async_user_connect(self, ssid: str, password: str | None = None, timeout: float = 30.0) -> "ConnectResult":
+        """Łączenie na żądanie użytkownika: najpierw przerywa trwającą próbę auto-connect."""
+        await self.auto_connect.cancel_attempt()
+        return await self._async_connect(ssid, password, timeout)
+
+    async def _async_connect(self, ssid: str, password: str | None = None, timeout: float = 30.0) -> "ConnectResult":
+        """Łączenie (ręczne lub automatyczne); wynik trafia też do historii AutoConnect."""
+        self.connects_in_flight += 1
+        try:
+            result = await self._async_activate(ssid, password, timeout)
+        finally:
+            self.connects_in_flight -= 1
+        self.auto_connect.record(result)
+        return result
+
+    async def _async_activate(self, ssid: str, password: str | None = None, timeout: float = 30.0) -> "ConnectResult":
+        print(f"[NM LOG] _async_connect called for SSID: {ssid}")
+        try:
+            async with asyncio.timeout(timeout):
+                nm_obj = await self._get_proxy(self.NM_PATH)
+                nm_iface = nm_obj.get_interface(self.NM_BUS_NAME)
+                device, specific_object = self._wifi_device_for(ssid)
+                profile = self._profiles.get(ssid.encode())
+                if profile is not None:
+                    # Znany profil: szybka ścieżka NM, bez dokładania kolejnego profilu
+                    print(f"[NM LOG] Reusing saved profile {profile} for {ssid}")
+                    if password:
+                        await self._async_set_profile_psk(profile, password)
+                    active_path = await nm_iface.call_activate_connection(profile, device, specific_object)
+                    state, reason = await self._async_wait_for_activation(active_path)
+                    if (state != self.NM_ACTIVE_STATE_ACTIVATED and reason == self.NM_ACTIVE_REASON_NO_SECRETS
+                            and password and await self._async_set_profile_psk(profile, password, force=True)):
+                        print(f"[NM LOG] Retrying {ssid} with the updated password")
+                        active_path = await nm_iface.call_activate_connection(profile, device, specific_object)
+                        state, reason = await self._async_wait_for_activation(active_path)
+                else:
+                    settings = {
+                        "connection": {"id": Variant("s", ssid), "type": Variant("s", "802-11-wireless")},
+                        "802-11-wireless": {"ssid": Variant("ay", ssid.encode()), "mode": Variant("s", "infrastructure")},
+                        "ipv4": {"method": Variant("s", "auto")},
+                        "ipv6": {"method": Variant("s", "ignore")}
+                    }
+                    if password:
+                        settings["802-11-wireless-security"] = {"key-mgmt": Variant("s", "wpa-psk"), "psk": Variant("s", password)}
+                    profile, active_path = await nm_iface.call_add_and_activate_connection(settings, device, specific_object)
+                    state, reason = await self._async_wait_for_activation(active_path)
+        except TimeoutError:
+            print(f"[NM LOG] async_connect timed out after {timeout}s")
+            return ConnectResult(ssid, False, self.NM_ACTIVE_STATE_UNKNOWN, self.NM_ACTIVE_REASON_CONNECT_TIMEOUT)
+        except Exception as e:
+            print("[NM LOG] async_connect error:", e)
+            return ConnectResult(ssid, False, self.NM_ACTIVE_STATE_UNKNOWN, self.NM_ACTIVE_REASON_UNKNOWN)
+
+        await self._async_update_current_connection()
+        return ConnectResult(ssid, state == self.NM_ACTIVE_STATE_ACTIVATED, state, reason)
+
+    async def _async_wait_for_activation(self, active_path: str):
+        """Czeka na StateChanged aktywnego połączenia aż do ACTIVATED albo DEACTIVATED."""
+        # StateChanged mógł przyjść, zanim Add(And)ActivateConnection zwróciło ścieżkę
+        early = self._activation_results.pop(active_path, None)
+        if early is not None:
+            return early[:2]
+        waiter = self._loop.create_future()
+        self._activation_waiters[active_path] = waiter
+        try:
+            # Sygnał mógł przyjść zanim zarejestrowaliśmy waiter - sprawdź bieżący stan
+            try:
+                state = (await self._get_all(active_path, self.NM_ACTIVE_IFACE)).get("State")
+                if state in (self.NM_ACTIVE_STATE_ACTIVATED, self.NM_ACTIVE_STATE_DEACTIVATED) and not waiter.done():
+                    waiter.set_result((state, self.NM_ACTIVE_REASON_NONE))
+            except Exception:
+                # Obiekt zniknął - końcowy StateChanged mógł przyjść w międzyczasie
+                early = self._activation_results.pop(active_path, None)
+                if early is not None and not waiter.done():
+                    waiter.set_result(early[:2])
+            return await waiter
+        finally:
+            self._activation_waiters.pop(active_path, None)
+            self._activation_results.pop(active_path, None)
+
+    def _on_active_state_changed(self, msg):
+        state, reason = msg.body
+        if state in (self.NM_ACTIVE_STATE_ACTIVATED, self.NM_ACTIVE_STATE_DEACTIVATED):
+            waiter = self._activation_waiters.get(msg.path)
+            if waiter is not None:
+                if not waiter.done():
+                    waiter.set_result((state, reason))
+            else:
+                # Nikt jeszcze nie czeka (np. aktywacja zwróciła ścieżkę, ale korutyna nie wróciła) -
+                # zapamiętaj na chwilę, żeby waiter dostał prawdziwy powód zamiast timeoutu
+                now = time.monotonic()
+                self._activation_results = {
+                    path: result for path, result in self._activation_results.items()
+                    if now - result[2] < self.ACTIVATION_RESULT_TTL
+                }
+                self._activation_results[msg.path] = (state, reason, now)
+        self._schedule_connection_update()
+
     def stop(self):
         self._running = False
         try:
             if self._loop and self._loop.is_running():
                 print("[NM LOG] Stopping asyncio loop")
+                self._loop.call_soon_threadsafe(self.auto_connect.stop)
                 self._loop.call_soon_threadsafe(self._loop.stop)
         except Exception:
             pass
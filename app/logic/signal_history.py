@@ -0,0 +1,122 @@
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy jest opcjonalny - bez niego liczymy w czystym Pythonie
+    np = None
+
+DEFAULT_HISTORY_SIZE = 32
+DEFAULT_EMA_ALPHA = 0.3
+DEFAULT_HYSTERESIS = 5  # punkty procentowe
+
+# Granice poziomów ikony: <40 -> 1 kreska, 40..69 -> 2, >=70 -> 3
+LEVEL_THRESHOLDS = (40, 70)
+
+
+def signal_level(strength: float, previous: int = 0, margin: int = DEFAULT_HYSTERESIS) -> int:
+    """Poziom 1-3 dla siły sygnału. Przy znanym poprzednim poziomie granica musi zostać
+    przekroczona o `margin`, żeby poziom się zmienił (brak migotania na progu).
+    `previous` <= 0 (brak połączenia, -1 = jeszcze nic nie narysowano) nie daje histerezy.
+
+    >>> signal_level(72), signal_level(72, previous=-1), signal_level(72, previous=2), signal_level(68, previous=3)
+    (3, 3, 2, 3)
+    """
+    level = 1 + sum(strength >= t for t in LEVEL_THRESHOLDS)
+    if previous <= 0 or level == previous:
+        return level
+    if level > previous:
+        return max(previous, 1 + sum(strength >= t + margin for t in LEVEL_THRESHOLDS))
+    return min(previous, 1 + sum(strength >= t - margin for t in LEVEL_THRESHOLDS))
+
+
+class SignalHistory:
+    """Bufor cykliczny (czas, siła) dla jednego BSSID na tablicach `array`.
+
+    `smoothed` to EMA liczona przyrostowo, `median()` i `trend()` liczą po całym oknie
+    (wektorowo, jeśli jest NumPy). `stable` to wygładzona wartość z histerezą - zmienia się
+    dopiero, gdy EMA odejdzie od niej o co najmniej `margin`, więc nadaje się do rysowania.
+
+    >>> history = SignalHistory(size=4, alpha=0.5, margin=3)
+    >>> [history.push(value, timestamp) for timestamp, value in enumerate((60, 62, 70, 70))]
+    [True, False, True, False]
+    >>> history.stable, history.median(), history.trend()
+    (66, 66.0, 3.8)
+    """
+
+    __slots__ = ("_times", "_values", "_size", "_count", "_head", "_alpha", "_margin", "_ema", "_stable")
+
+    def __init__(self, size: int = DEFAULT_HISTORY_SIZE, alpha: float = DEFAULT_EMA_ALPHA,
+                 margin: int = DEFAULT_HYSTERESIS):
+        self._size = max(2, int(size))
+        self._times = array("d", [0.0]) * self._size
+        self._values = array("d", [0.0]) * self._size
+        self._count = 0
+        self._head = 0
+        self._alpha = alpha
+        self._margin = margin
+        self._ema: float | None = None
+        self._stable: int | None = None
+
+    def push(self, strength: float, timestamp: float | None = None) -> bool:
+        """Dodaje odczyt; zwraca True, jeśli zmieniła się wartość `stable`."""
+        self._times[self._head] = time.monotonic() if timestamp is None else timestamp
+        self._values[self._head] = strength
+        self._head = (self._head + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+
+        self._ema = strength if self._ema is None else self._alpha * strength + (1 - self._alpha) * self._ema
+        value = round(self._ema)
+        if self._stable is None or abs(value - self._stable) >= self._margin:
+            self._stable = value
+            return True
+        return False
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def latest(self) -> float | None:
+        return self._values[self._head - 1] if self._count else None
+
+    @property
+    def smoothed(self) -> float | None:
+        return self._ema
+
+    @property
+    def stable(self) -> int | None:
+        return self._stable
+
+    # Mediana i regresja nie zależą od kolejności próbek, więc wystarczy
+    # pierwszych `_count` komórek - bez obracania bufora.
+
+    def median(self) -> float | None:
+        if not self._count:
+            return None
+        if np is not None:
+            return float(np.median(np.frombuffer(self._values, dtype=np.float64, count=self._count)))
+        values = sorted(self._values[:self._count])
+        mid = self._count // 2
+        return values[mid] if self._count % 2 else (values[mid - 1] + values[mid]) / 2
+
+    def trend(self) -> float:
+        """Nachylenie prostej najmniejszych kwadratów w punktach procentowych na sekundę."""
+        if self._count < 2:
+            return 0.0
+        if np is not None:
+            t = np.frombuffer(self._times, dtype=np.float64, count=self._count)
+            v = np.frombuffer(self._values, dtype=np.float64, count=self._count)
+            dt = t - t.mean()
+            var = float(dt @ dt)
+            return float(dt @ (v - v.mean())) / var if var else 0.0
+        t = self._times[:self._count]
+        v = self._values[:self._count]
+        t_mean = sum(t) / self._count
+        v_mean = sum(v) / self._count
+        var = sum((x - t_mean) ** 2 for x in t)
+        if not var:
+            return 0.0
+        return sum((x - t_mean) * (y - v_mean) for x, y in zip(t, v)) / var
+
+    def __repr__(self):
+        return f"SignalHistory({self._count}/{self._size}, stable={self._stable}, ema={self._ema})"
@@ -0,0 +1,66 @@
+from types import MappingProxyType
+
+
+def _freeze(networks) -> tuple:
+    # Krotka tylko-do-odczytu map: net["ssid"], net.get("strength") działają jak wcześniej
+    return tuple(MappingProxyType(dict(net)) for net in networks)
+
+
+class InterfaceScan:
+    """Wynik jednego adaptera Wi-Fi: jego sieci (z jego własnych AP) i czas ostatniego skanu.
+    `last_scan` to LastScan z NM (ms od startu systemu, -1 = nigdy)."""
+
+    __slots__ = ("interface", "device", "last_scan", "networks")
+
+    def __init__(self, interface: str, device: str | None, last_scan: int, networks):
+        object.__setattr__(self, "interface", interface)
+        object.__setattr__(self, "device", device)
+        object.__setattr__(self, "last_scan", last_scan)
+        object.__setattr__(self, "networks", _freeze(networks))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("InterfaceScan is immutable")
+
+    def __iter__(self):
+        return iter(self.networks)
+
+    def __len__(self):
+        return len(self.networks)
+
+    def __repr__(self):
+        return f"InterfaceScan({self.interface}, {len(self.networks)} networks, last_scan={self.last_scan})"
+
+
+class NetworkSnapshot:
+    """Niezmienny stan listy sieci publikowany przez NetworkManager.
+
+    Wątek asyncio tworzy nowy snapshot przy każdej zmianie i podmienia referencję;
+    wątek Qt czyta go bez kopiowania. `version` rośnie monotonicznie, więc konsument
+    może pominąć rysowanie, jeśli wersja się nie zmieniła.
+
+    `networks` to widok scalony ze wszystkich adapterów, `interfaces` - wyniki
+    osobno dla każdego interfejsu (nazwa -> InterfaceScan).
+    """
+
+    __slots__ = ("version", "networks", "current", "interfaces")
+
+    def __init__(self, version: int, networks, current: str | None, interfaces=None):
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "networks", _freeze(networks))
+        object.__setattr__(self, "current", current)
+        object.__setattr__(self, "interfaces", MappingProxyType(dict(interfaces or {})))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("NetworkSnapshot is immutable")
+
+    def __iter__(self):
+        return iter(self.networks)
+
+    def __len__(self):
+        return len(self.networks)
+
+    def __repr__(self):
+        return f"NetworkSnapshot(v{self.version}, {len(self.networks)} networks, current={self.current!r})"
+
+
+EMPTY_SNAPSHOT = NetworkSnapshot(0, (), None)
@@ -3,7 +3,6 @@ import os
 from PyQt5.QtWidgets import (
     QApplication, QSystemTrayIcon, QMenu, QAction, QWidget
 )
-from PyQt5.QtGui import QIcon, QPixmap, QPainter
 from PyQt5.QtCore import QTimer, QSize
 
 # Dodaj ścieżkę do projektu jeśli potrzebne
@@ -13,6 +12,7 @@ from app.ui.main_wifi import ModernWifiWindow
 from app.logic.network_manager import NetworkManager
 from app.config import ConfigManager
 from app.ui.styles.styles import UnifiedStyles
+from app.ui import icons
 
 
 class TrayApp:
@@ -21,7 +21,7 @@ class TrayApp:
         self.config = ConfigManager()
         self.network_manager = NetworkManager(self.config)
         
-        self.app.setStyleSheet(UnifiedStyles.get_stylesheet())
+        UnifiedStyles.apply(self.app, self.config.get('theme', 'dark'))
         self.app.setApplicationName("Wi-Fi Manager")
         self.app.setApplicationVersion("1.0.0")
         self.app.setQuitOnLastWindowClosed(False)
@@ -55,30 +55,8 @@ class TrayApp:
             QTimer.singleShot(1000, self.main_window.trigger_initial_scan)
 
     def create_tray_icon(self):
-        """Tworzy prostą ikonę WiFi dla system tray"""
-        size = 64
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Rysujemy ikonę WiFi
-        center = size // 2
-        painter.setPen(QPen(QColor("#10b981"), 3))
-        painter.setBrush(Qt.NoBrush)
-        
-        # Rysujemy kręgi (sygnał WiFi)
-        radii = [20, 15, 10, 5]
-        for radius in radii:
-            painter.drawEllipse(center - radius, center - radius, radius * 2, radius * 2)
-        
-        # Rysujemy centralną kropkę
-        painter.setBrush(QBrush(QColor("#10b981")))
-        painter.drawEllipse(center - 2, center - 2, 4, 4)
-        
-        painter.end()
-        return QIcon(pixmap)
+        """Prosta ikona WiFi dla system tray (rysowana raz, ze wspólnego cache)"""
+        return icons.app_tray_icon()
 
     def on_tray_click(self, reason):
         if reason == QSystemTrayIcon.Trigger:  
@@ -91,6 +69,7 @@ class TrayApp:
             self.main_window.show()
             self.main_window.raise_()
             self.main_window.activateWindow()
+            self.main_window.trigger_initial_scan(active=True)
 
     def run(self):
         return self.app.exec_()
@@ -20,8 +20,14 @@ class ConnectionForm(QWidget):
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
         # Marginesy wewnątrz strony
-        layout.setContentsMargins(24, 10, 24, 20)# Pycha treść do środka
-        self.network_icon.setObjectName("connection_icon_large") # Wymaga stylu w CSS
+        layout.setContentsMargins(24, 10, 24, 20)
+
+        # Pycha treść do środka
+        info_layout = QVBoxLayout()
+        info_layout.setSpacing(4)
+
+        self.network_icon = QLabel()
+        self.network_icon.setObjectName("connection_icon_large") # Styl w UnifiedStyles
         self.network_icon.setAlignment(Qt.AlignCenter)
         self.network_icon.setFixedSize(64, 64)
         
@@ -34,11 +40,10 @@ class ConnectionForm(QWidget):
         self.network_ssid = QLabel("Unknown")
         self.network_ssid.setObjectName("connection_ssid_large") 
         self.network_ssid.setAlignment(Qt.AlignCenter)
-        self.network_ssid.setStyleSheet("font-size: 16px; font-weight: bold; color: white;")
         info_layout.addWidget(self.network_ssid)
 
         self.status_label = QLabel("Enter password to connect")
-        self.status_label.setStyleSheet("color: #a1a1aa; font-size: 12px;")
+        self.status_label.setObjectName("connection_status")
         self.status_label.setAlignment(Qt.AlignCenter)
         info_layout.addWidget(self.status_label)
 
@@ -0,0 +1,118 @@
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt5.QtGui import QFont, QFontMetrics, QPainter, QPen
+from PyQt5.QtCore import Qt, QRect, QRectF, QSize
+
+from app.logic.signal_history import signal_level
+from app.ui import icons
+from app.ui.styles.styles import UnifiedStyles
+from app.ui.components.network_model import NetworkListModel
+
+
+class NetworkItemDelegate(QStyledItemDelegate):
+    """Rysuje wiersz sieci (ikona sygnału, SSID, status, akcja) bez żadnych widżetów na wiersz."""
+
+    ROW_HEIGHT = 60
+    BUTTON_SIZE = QSize(60, 26)
+
+    STATUS_TEXTS = ("Weak", "Good", "Excellent")  # poziomy 1-3 wg signal_history.LEVEL_THRESHOLDS
+
+    @staticmethod
+    def status_text(strength, connected):
+        if connected:
+            return "Current network"
+        return NetworkItemDelegate.STATUS_TEXTS[signal_level(strength) - 1]
+
+    @staticmethod
+    def _font(base, pixel_size, weight):
+        font = QFont(base)
+        font.setPixelSize(pixel_size)
+        font.setWeight(weight)
+        return font
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width() or 330, self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        ssid = index.data(NetworkListModel.SsidRole) or ""
+        strength = index.data(NetworkListModel.StrengthRole) or 0
+        secured = index.data(NetworkListModel.SecuredRole)
+        connected = index.data(NetworkListModel.ConnectedRole)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        colors = UnifiedStyles.list_colors()  # zależne od motywu, cache w UnifiedStyles
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+
+        # Kontener: 95% szerokości, wyśrodkowany, zaokrąglony
+        row = option.rect.adjusted(0, 2, 0, -2)
+        width = int(row.width() * 0.95)
+        rect = QRect(row.x() + (row.width() - width) // 2, row.y(), width, row.height())
+        if connected or hovered:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(colors["connected_bg"] if connected else colors["hover"])
+            painter.drawRoundedRect(QRectF(rect), 8, 8)
+
+        # 1. Ikona sygnału
+        icon_rect = QRect(rect.left() + 16, rect.center().y() - 12, 24, 24)
+        pixmap = icons.signal_pixmap(signal_level(strength))
+        if not pixmap.isNull():
+            size = pixmap.size() / pixmap.devicePixelRatio()
+            target = QRect(0, 0, size.width(), size.height())
+            target.moveCenter(icon_rect.center())
+            painter.drawPixmap(target, pixmap)
+        else:
+            painter.setPen(colors["status"])
+            painter.setFont(self._font(option.font, 18, QFont.Normal))
+            painter.drawText(icon_rect, Qt.AlignCenter, "📶")
+
+        # 3. Akcja po prawej (liczona przed tekstem, żeby znać jej szerokość)
+        right = rect.right() - 16
+        if connected:
+            font = self._font(option.font, 11, QFont.DemiBold)
+            label = "Connected"
+            action_width = QFontMetrics(font).horizontalAdvance(label)
+            action_rect = QRect(right - action_width, rect.top(), action_width, rect.height())
+            painter.setFont(font)
+            painter.setPen(colors["accent"])
+            painter.drawText(action_rect, Qt.AlignRight | Qt.AlignVCenter, label)
+        elif secured:
+            font = self._font(option.font, 24, QFont.Light)
+            action_width = 12
+            action_rect = QRect(right - action_width, rect.top(), action_width, rect.height() - 4)
+            painter.setFont(font)
+            painter.setPen(colors["accent"] if hovered else colors["chevron"])
+            painter.drawText(action_rect, Qt.AlignRight | Qt.AlignVCenter, "›")
+        else:
+            action_width = self.BUTTON_SIZE.width()
+            action_rect = QRect(0, 0, action_width, self.BUTTON_SIZE.height())
+            action_rect.moveCenter(rect.center())
+            action_rect.moveRight(right)
+            painter.setPen(QPen(colors["accent"] if hovered else colors["button_border"], 1))
+            painter.setBrush(colors["button_hover"] if hovered else Qt.NoBrush)
+            painter.drawRoundedRect(QRectF(action_rect).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+            painter.setFont(self._font(option.font, 11, QFont.DemiBold))
+            painter.setPen(colors["accent"])
+            painter.drawText(action_rect, Qt.AlignCenter, "Connect")
+
+        # 2. Środek: SSID i status
+        text_left = icon_rect.right() + 16
+        text_rect = QRect(text_left, rect.top(), max(0, action_rect.left() - 16 - text_left), rect.height())
+        name_font = self._font(option.font, 14, QFont.DemiBold)
+        status_font = self._font(option.font, 11, QFont.Normal)
+        painter.setFont(name_font)
+        name_height = painter.fontMetrics().height()
+        elided = painter.fontMetrics().elidedText(ssid, Qt.ElideRight, text_rect.width())
+        painter.setFont(status_font)
+        status_height = painter.fontMetrics().height()
+        top = text_rect.top() + (text_rect.height() - name_height - 2 - status_height) // 2
+
+        painter.setFont(name_font)
+        painter.setPen(colors["name"])
+        painter.drawText(QRect(text_left, top, text_rect.width(), name_height), Qt.AlignLeft | Qt.AlignVCenter, elided)
+        painter.setFont(status_font)
+        painter.setPen(colors["status"])
+        painter.drawText(QRect(text_left, top + name_height + 2, text_rect.width(), status_height),
+                         Qt.AlignLeft | Qt.AlignVCenter, self.status_text(strength, connected))
+
+        painter.restore()
@@ -1,45 +1,39 @@
-from PyQt5.QtWidgets import QScrollArea, QWidget, QVBoxLayout, QLabel
+from PyQt5.QtWidgets import QListView, QAbstractItemView
 from PyQt5.QtCore import Qt, pyqtSignal
 
-from app.ui.components.network_item import NetworkItem
+from app.ui.components.network_model import NetworkListModel
+from app.ui.components.network_delegate import NetworkItemDelegate
 
-class NetworkList(QScrollArea):
-    network_clicked = pyqtSignal(str, bool) 
+class NetworkList(QListView):
+    network_clicked = pyqtSignal(str, bool)  # ssid, is_secured
 
-    def __init__(self, network_manager, parent=None): 
-        super().__init__(parent)         
+    def __init__(self, network_manager, parent=None):
+        super().__init__(parent)
         self.network_manager = network_manager
-        
-        self.setWidgetResizable(True)
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.setStyleSheet("background: transparent; border: none;")
-        
-        self.container = QWidget()
-        self.container.setObjectName("network_list_container")
-        self.layout = QVBoxLayout(self.container)
-        self.layout.setSpacing(4)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.addStretch()  
-        
-        self.setWidget(self.container)
 
-    def display_networks(self, networks):
-        while self.layout.count() > 1:
-            child = self.layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        self.network_model = NetworkListModel(self)
+        self.setModel(self.network_model)
+        self.setItemDelegate(NetworkItemDelegate(self))
 
-        for net in networks:
-            self.add_network_item(net)
+        # Wszystkie wiersze mają tę samą wysokość - widok nie pyta delegata o każdy wiersz
+        self.setUniformItemSizes(True)
+        self.setSpacing(2)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WA_Hover)
+        self.viewport().setCursor(Qt.PointingHandCursor)
+        self.setObjectName("network_list")  # tło i ramka: UnifiedStyles
 
-    def add_network_item(self, net_data):
-        ssid = net_data.get('ssid', 'Unknown')
-        strength = net_data.get('strength', 0)
-        secured = net_data.get('secured', False)
-        connected = net_data.get('connected', False)
+        self.clicked.connect(self.on_item_clicked)
 
-        item = NetworkItem(ssid, strength, secured, connected)
-        
-        item.network_selected.connect(self.network_clicked.emit)
+    def display_networks(self, networks):
+        self.network_model.set_networks(networks)
 
-        self.layout.insertWidget(self.layout.count() - 1, item)
\ No newline at end of file
+    def on_item_clicked(self, index):
+        ssid = index.data(NetworkListModel.SsidRole)
+        if ssid:
+            self.network_clicked.emit(ssid, bool(index.data(NetworkListModel.SecuredRole)))
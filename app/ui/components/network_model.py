@@ -0,0 +1,61 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class NetworkListModel(QAbstractListModel):
+    """Model listy sieci nad niezmienną krotką rekordów ze snapshotu backendu.
+
+    Rekordy (MappingProxyType) nie są kopiowane - model tylko trzyma referencję do krotki.
+    Gdy kolejność SSID się nie zmienia, zgłaszany jest dataChanged dla zmienionych wierszy;
+    inaczej model jest resetowany (widok i tak rysuje wyłącznie widoczne wiersze).
+    """
+
+    SsidRole = Qt.UserRole + 1
+    StrengthRole = Qt.UserRole + 2
+    SecuredRole = Qt.UserRole + 3
+    ConnectedRole = Qt.UserRole + 4
+    NetworkRole = Qt.UserRole + 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._networks = ()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._networks)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._networks):
+            return None
+        net = self._networks[index.row()]
+        if role in (Qt.DisplayRole, self.SsidRole):
+            return net.get('ssid', 'Unknown')
+        if role == self.StrengthRole:
+            return int(net.get('strength', 0))
+        if role == self.SecuredRole:
+            return bool(net.get('secured', False))
+        if role == self.ConnectedRole:
+            return bool(net.get('connected', False))
+        if role == self.NetworkRole:
+            return net
+        return None
+
+    def roleNames(self):
+        return {
+            self.SsidRole: b"ssid",
+            self.StrengthRole: b"strength",
+            self.SecuredRole: b"secured",
+            self.ConnectedRole: b"connected",
+        }
+
+    def set_networks(self, networks):
+        networks = tuple(networks)
+        old = self._networks
+        if [n.get('ssid') for n in old] != [n.get('ssid') for n in networks]:
+            self.beginResetModel()
+            self._networks = networks
+            self.endResetModel()
+            return
+
+        self._networks = networks
+        changed = [row for row, (a, b) in enumerate(zip(old, networks)) if a != b]
+        if changed:
+            self.dataChanged.emit(self.index(changed[0]), self.index(changed[-1]))
@@ -9,6 +9,8 @@ class SettingsTab(QWidget):
         super().__init__()
         self.config = config
         self.network_manager = network_manager
+        # Wygląd grup, checkboxów i comboboxów pochodzi z UnifiedStyles (QWidget#settings_page ...)
+        self.setObjectName("settings_page")
         self.init_ui()
         
         # WAŻNE: Wczytaj ustawienia z pliku przy starcie
@@ -22,14 +24,6 @@ class SettingsTab(QWidget):
         # Tytuł
         title = QLabel("Settings")
         title.setObjectName("settings_title")
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: 700;
-                color: #10b981;
-                background: transparent;
-            }
-        """)
         layout.addWidget(title)
         
         # --- Sekcja General ---
@@ -46,11 +40,10 @@ class SettingsTab(QWidget):
         self.app_group = self.create_group("Appearance")
         theme_layout = QHBoxLayout()
         theme_label = QLabel("Theme:")
-        theme_label.setStyleSheet("color: #e4e4e7; font-size: 11px; font-weight: 600;")
+        theme_label.setProperty("class", "settings-label")
         
         self.theme_combo = QComboBox()
         self.theme_combo.addItems(["Dark", "Light", "Auto"])
-        self.theme_combo.setStyleSheet(self.get_combo_style())
         # Zapisz przy zmianie
         self.theme_combo.currentTextChanged.connect(self.save_settings)
         
@@ -68,11 +61,10 @@ class SettingsTab(QWidget):
         
         interval_layout = QHBoxLayout()
         interval_label = QLabel("Scan Interval:")
-        interval_label.setStyleSheet("color: #e4e4e7; font-size: 11px; font-weight: 600;")
+        interval_label.setProperty("class", "settings-label")
         
         self.scan_interval_combo = QComboBox()
         self.scan_interval_combo.addItems(["5s", "10s", "30s", "1m", "5m"])
-        self.scan_interval_combo.setStyleSheet(self.get_combo_style())
         # Zapisz przy zmianie
         self.scan_interval_combo.currentTextChanged.connect(self.save_settings)
         
@@ -89,25 +81,6 @@ class SettingsTab(QWidget):
     
     def create_group(self, title):
         group = QGroupBox(title)
-        group.setStyleSheet("""
-            QGroupBox {
-                background: rgba(24, 24, 27, 0.65);
-                border: 1.2px solid rgba(16, 185, 129, 0.35);
-                border-radius: 7px;
-                margin-top: 5px;
-                padding: 10px 10px 6px 10px;
-                font-size: 11px;
-                color: #10b981;
-                font-weight: 600;
-            }
-            QGroupBox::title {
-                color: #10b981;
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 5px;
-                background: transparent;
-            }
-        """)
         l = QVBoxLayout()
         l.setSpacing(5)
         l.setContentsMargins(0, 5, 0, 0)
@@ -116,57 +89,17 @@ class SettingsTab(QWidget):
 
     def create_checkbox(self, text):
         cb = QCheckBox(text)
-        cb.setStyleSheet("""
-            QCheckBox {
-                color: #e4e4e7;
-                background: transparent;
-                spacing: 8px;
-                font-size: 11px;
-                font-weight: 500;
-                padding: 3px 0px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 1.5px solid rgba(16, 185, 129, 0.5);
-                border-radius: 3px;
-                background: rgba(255, 255, 255, 0.06);
-            }
-            QCheckBox::indicator:checked {
-                background: #10b981;
-                border: 1.5px solid #10b981;
-            }
-            QCheckBox::indicator:hover {
-                border: 1.5px solid rgba(16, 185, 129, 0.8);
-            }
-        """)
         cb.stateChanged.connect(self.save_settings)
         return cb
     
-    def get_combo_style(self):
-        return """
-            QComboBox {
-                background: rgba(255, 255, 255, 0.07);
-                border: 1.2px solid rgba(16, 185, 129, 0.35);
-                border-radius: 5px;
-                padding: 3px 6px;
-                color: #ffffff;
-                font-size: 11px;
-                min-width: 80px;
-            }
-            QComboBox:hover { border: 1.2px solid rgba(16, 185, 129, 0.55); }
-            QComboBox QAbstractItemView {
-                background: #0a0e1a;
-                border: 1px solid #333;
-                selection-background-color: rgba(16, 185, 129, 0.35);
-                color: #e4e4e7;
-            }
-        """
-
     def load_current_settings(self):
         """Pobiera dane z ConfigManager i ustawia stan kontrolek UI"""
-        # Blokujemy sygnały, aby ustawianie wartości nie wywołało metody save_settings
-        self.blockSignals(True)
+        # Blokujemy sygnały kontrolek, aby ustawianie wartości nie wywołało metody save_settings
+        # (inaczej pierwszy checkbox zapisałby jeszcze niewczytany motyw i interwał do configu)
+        controls = (self.auto_start_cb, self.minimize_tray_cb, self.auto_scan_cb,
+                    self.auto_connect_cb, self.theme_combo, self.scan_interval_combo)
+        for control in controls:
+            control.blockSignals(True)
         
         # Checkboxy (używamy kluczy z Twojego Config Managera)
         self.auto_start_cb.setChecked(self.config.get('auto_start', False))
@@ -194,7 +127,8 @@ class SettingsTab(QWidget):
         if interval_idx >= 0:
             self.scan_interval_combo.setCurrentIndex(interval_idx)
         
-        self.blockSignals(False)
+        for control in controls:
+            control.blockSignals(False)
 
     def save_settings(self):
         """Pobiera stan z UI i zapisuje przez ConfigManager"""
@@ -0,0 +1,120 @@
+"""Wspólny cache ikon i pixmap aplikacji.
+
+Każdy asset jest wczytywany z dysku i skalowany raz dla danego rozmiaru i device-pixel-ratio;
+ikony rysowane programowo (fallbacki) też powstają tylko raz. Kolejne wywołania
+zwracają gotowe obiekty z pamięci - przebudowa listy czy zmiana poziomu w trayu nie robi I/O.
+Wołać wyłącznie z wątku GUI (QPixmap), po utworzeniu QApplication.
+"""
+import os
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QBrush, QColor, QGuiApplication, QIcon, QPainter, QPen, QPixmap
+
+ASSETS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'assets'))
+
+SIGNAL_ICON_SIZE = 20
+TRAY_ICON_SIZE = 48
+FALLBACK_ICON_SIZE = 64
+
+# Poziom sygnału -> plik (lista sieci: 1-3 kreski; tray: 0 = brak połączenia / Wi-Fi off)
+SIGNAL_ICONS = {1: 'net_icon_1.png', 2: 'net_icon_2.png', 3: 'net_icon_3.png'}
+TRAY_ICONS = {0: 'wifi_0.png', 1: 'wifi_1.png', 2: 'wifi_2.png', 3: 'wifi.png'}
+
+_pixmaps = {}
+_icons = {}
+
+
+def _device_pixel_ratio():
+    app = QGuiApplication.instance()
+    return app.devicePixelRatio() if app is not None else 1.0
+
+
+def pixmap(name, size):
+    """Asset z app/assets przeskalowany do kwadratu `size` (px logiczne) - pusty QPixmap, jeśli go brak."""
+    dpr = _device_pixel_ratio()
+    key = (name, size, dpr)
+    cached = _pixmaps.get(key)
+    if cached is None:
+        cached = QPixmap(os.path.join(ASSETS_DIR, name))
+        if not cached.isNull():
+            physical = int(round(size * dpr))
+            cached = cached.scaled(physical, physical, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            cached.setDevicePixelRatio(dpr)
+        _pixmaps[key] = cached
+    return cached
+
+
+def _cached_icon(key, factory):
+    key = key + (_device_pixel_ratio(),)
+    icon = _icons.get(key)
+    if icon is None:
+        icon = _icons[key] = factory()
+    return icon
+
+
+def signal_pixmap(level):
+    """Ikona siły sygnału (1-3) dla wiersza listy sieci."""
+    return pixmap(SIGNAL_ICONS.get(level, SIGNAL_ICONS[1]), SIGNAL_ICON_SIZE)
+
+
+def tray_icon(level):
+    """Ikona traya dla poziomu 0-3; gdy brak pliku - rysowany fallback."""
+    def build():
+        scaled = pixmap(TRAY_ICONS.get(level, TRAY_ICONS[3]), TRAY_ICON_SIZE)
+        if scaled.isNull():
+            return fallback_wifi_icon()
+        icon = QIcon(scaled)
+        icon.addPixmap(scaled, QIcon.Normal)
+        icon.addPixmap(scaled, QIcon.Active)
+        return icon
+    return _cached_icon(("tray", level), build)
+
+
+def _new_canvas(size):
+    dpr = _device_pixel_ratio()
+    canvas = QPixmap(int(round(size * dpr)), int(round(size * dpr)))
+    canvas.setDevicePixelRatio(dpr)
+    canvas.fill(Qt.transparent)
+    return canvas
+
+
+def fallback_wifi_icon():
+    """Biała ikona Wi-Fi (łuki + kropka), gdy brakuje plików traya."""
+    def build():
+        canvas = _new_canvas(FALLBACK_ICON_SIZE)
+        painter = QPainter(canvas)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(255, 255, 255), 4))
+        painter.drawArc(10, 20, 44, 44, 0, 180 * 16)
+        painter.drawArc(18, 28, 28, 28, 0, 180 * 16)
+        painter.drawArc(26, 36, 12, 12, 0, 180 * 16)
+        painter.setBrush(QBrush(QColor(255, 255, 255)))
+        painter.drawEllipse(28, 46, 8, 8)
+        painter.end()
+        return QIcon(canvas)
+    return _cached_icon(("fallback_wifi",), build)
+
+
+def app_tray_icon():
+    """Zielona ikona (koncentryczne kręgi) używana przez TrayApp."""
+    def build():
+        size = FALLBACK_ICON_SIZE
+        center = size // 2
+        canvas = _new_canvas(size)
+        painter = QPainter(canvas)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor("#10b981"), 3))
+        painter.setBrush(Qt.NoBrush)
+        for radius in (20, 15, 10, 5):
+            painter.drawEllipse(center - radius, center - radius, radius * 2, radius * 2)
+        painter.setBrush(QBrush(QColor("#10b981")))
+        painter.drawEllipse(center - 2, center - 2, 4, 4)
+        painter.end()
+        return QIcon(canvas)
+    return _cached_icon(("app_tray",), build)
+
+
+def clear():
+    """Czyści cache (np. po podmianie plików w app/assets)."""
+    _pixmaps.clear()
+    _icons.clear()
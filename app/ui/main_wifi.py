@@ -1,7 +1,6 @@
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 from PyQt5.QtCore import *
-import threading
 
 # --- IMPORTY KOMPONENTÓW ---
 from app.ui.components.wifi_switch import ModernWiFiSwitch
@@ -11,19 +10,24 @@ from app.ui.components.connection_form import ConnectionForm
 from app.ui.styles.styles import UnifiedStyles  # Upewnij się, że ścieżka jest poprawna
 
 class ModernWifiWindow(QWidget):
-    networks_updated = pyqtSignal(list)
+    networks_updated = pyqtSignal(object)  # NetworkSnapshot
+    FAILED_STATUS_MS = 8000
 
     def __init__(self, network_manager, config):
         super().__init__()
         self.network_manager = network_manager
         self.config = config
         self.wifi_on = True
+        self._rendered_version = None  # wersja snapshotu aktualnie narysowana na liście
         
         self.init_ui()
         
         # Sygnały
         self.networks_updated.connect(self.on_networks_updated)
+        self.network_manager.network_changed.connect(self.networks_updated)
         self.network_manager.connection_changed.connect(self.on_connection_changed)
+        self.network_manager.connect_finished.connect(self.on_connect_finished)
+        self.network_manager.auto_connect_started.connect(lambda ssid: self.update_status_label(ssid, "connecting"))
 
         # Aplikujemy ustawienia startowe (Theme, Scan interval, etc.)
         self.apply_settings()
@@ -104,8 +108,8 @@ class ModernWifiWindow(QWidget):
         layout_b.setContentsMargins(14, 0, 14, 0)
         
         self.current_network_label = QLabel("Initializing...")
-        self.current_network_label.setObjectName("network_status") # Używamy ID dla spójności czcionki
-        # Nadpisujemy kolor statusu dynamicznie w update_status_label, więc tutaj styl podstawowy wystarczy
+        self.current_network_label.setObjectName("network_status")
+        # Kolor zależy od właściwości "state" ustawianej w update_status_label (selektory w UnifiedStyles)
         layout_b.addWidget(self.current_network_label)
         
         layout_b.addStretch()
@@ -124,6 +128,12 @@ class ModernWifiWindow(QWidget):
         self.scan_timer.timeout.connect(self.trigger_initial_scan)
         # Timer zostanie uruchomiony/skonfigurowany w apply_settings
 
+        # Komunikat o nieudanym łączeniu wraca do zwykłego statusu po FAILED_STATUS_MS
+        self.failed_status_timer = QTimer(self)
+        self.failed_status_timer.setSingleShot(True)
+        self.failed_status_timer.setInterval(self.FAILED_STATUS_MS)
+        self.failed_status_timer.timeout.connect(self.reset_failed_status)
+
         QTimer.singleShot(500, self.trigger_initial_scan)
         QTimer.singleShot(100, self.position_at_bottom_right)
         self.update_status_label(None, "disconnected")
@@ -142,14 +152,11 @@ class ModernWifiWindow(QWidget):
         interval_str = self.config.get('scan_interval', '5s')
         auto_scan = self.config.get('auto_scan', True)
 
-        # 2. APLIKACJA MOTYWU (Dark/Light)
-        # Sprawdzamy, czy motyw faktycznie się zmienił, żeby nie mrugać niepotrzebnie
-        if not hasattr(self, '_current_theme') or self._current_theme != theme:
-            print(f"[UI] Applying theme: {theme}")
-            new_stylesheet = UnifiedStyles.get_stylesheet(theme)
-            QApplication.instance().setStyleSheet(new_stylesheet)
-            self._current_theme = theme
-            self.update() # Wymuś przerysowanie
+        # 2. APLIKACJA MOTYWU (Dark/Light/Auto)
+        # Arkusz jest cache'owany per motyw i ustawiany tylko przy faktycznej zmianie
+        # (przy starcie run.py już go nałożył, więc tu nic się nie dzieje)
+        if UnifiedStyles.apply(QApplication.instance(), theme):
+            print(f"[UI] Applying theme: {theme} ({UnifiedStyles.current_theme()})")
 
         # 3. Interwał skanowania
         ms = self.parse_interval(interval_str)
@@ -162,6 +169,10 @@ class ModernWifiWindow(QWidget):
         elif not auto_scan and self.scan_timer.isActive():
             self.scan_timer.stop()
 
+        # 5. Auto-Connect (silnik w backendzie sam czyta flagę; po włączeniu niech sprawdzi od razu)
+        if self.config.get('auto_connect', False) and self.wifi_on:
+            self.network_manager.request_auto_connect()
+
     def parse_interval(self, text):
         text = str(text).lower()
         if text.endswith('s'): return int(text[:-1]) * 1000
@@ -185,97 +196,110 @@ class ModernWifiWindow(QWidget):
 
     # --- LOGIKA SIECI ---
 
-    def on_networks_updated(self, networks):
-        current = getattr(self.network_manager, "current_network", None)
-        
-        # Logika Auto-Connect
-        auto_connect = self.config.get('auto_connect', False)
-        if auto_connect and not current and "Connecting" not in self.current_network_label.text():
-            # Tutaj można w przyszłości dodać logikę łączenia ze znanymi sieciami
-            pass
+    def on_networks_updated(self, snapshot):
+        current = snapshot.current
+        # Auto-connect działa w backendzie (AutoConnect) - tu tylko wyświetlamy stan
 
         # Aktualizacja statusu
-        if current: 
+        self.show_connection_status(current)
+
+        # Snapshot jest niezmienny i już posortowany (połączona -> siła sygnału);
+        # tę samą wersję rysujemy tylko raz
+        if snapshot.version == self._rendered_version:
+            return
+        self._rendered_version = snapshot.version
+        self.network_list.display_networks(snapshot.networks)
+
+    def show_connection_status(self, current):
+        """Status wynikający ze stanu backendu; nie przerywa trwającego "Connecting" ani świeżego "Failed"."""
+        if current:
             self.update_status_label(current, "connected")
-        elif self.current_network_label.text().startswith("Connecting"): 
-            pass 
-        else: 
+        elif self.current_network_label.property("state") not in ("connecting", "failed"):
             self.update_status_label(None, "disconnected")
 
-        # Sortowanie i wyświetlanie
-        for net in networks:
-            net["connected"] = (net["ssid"] == current)
-        
-        # Sortowanie: połączona -> siła sygnału
-        networks.sort(key=lambda x: (not x["connected"], -x.get("strength", 0)))
-        self.network_list.display_networks(networks)
+    def reset_failed_status(self):
+        if self.current_network_label.property("state") == "failed":
+            current = self.network_manager.current_network
+            self.update_status_label(current, "connected" if current else "disconnected")
 
-    def update_status_label(self, ssid=None, state="disconnected"):
-        """Aktualizuje tekst i kolor dolnego paska statusu"""
+    def update_status_label(self, ssid=None, state="disconnected", reason=None):
+        """Aktualizuje tekst dolnego paska statusu; kolor wynika z właściwości `state` (UnifiedStyles)"""
+        label = self.current_network_label
         if not self.wifi_on:
-            self.current_network_label.setText("Wi-Fi Off")
-            self.current_network_label.setStyleSheet("color: #71717a; font-size: 12px;") # Szary
-            return
-
-        if state == "connecting":
-            text = f"Connecting to {ssid}..." if ssid else "Connecting..."
-            self.current_network_label.setText(text)
-            self.current_network_label.setStyleSheet("color: #f59e0b; font-size: 12px; font-weight: 500;") # Pomarańczowy
-        
+            label.setText("Wi-Fi Off")
+            state = "off"
+        elif state == "connecting":
+            label.setText(f"Connecting to {ssid}..." if ssid else "Connecting...")
+        elif state == "failed":
+            text = f"Failed: {ssid}" if ssid else "Connection failed"
+            label.setText(f"{text} ({reason})" if reason else text)
         elif state == "connected" and ssid:
-            self.current_network_label.setText(f"Connected: {ssid}")
-            self.current_network_label.setStyleSheet("color: #10b981; font-size: 12px; font-weight: bold;") # Zielony
-        
+            label.setText(f"Connected: {ssid}")
         else:
-            self.current_network_label.setText("Not connected")
-            self.current_network_label.setStyleSheet("color: #94a3b8; font-size: 12px;") # Jasny szary
+            label.setText("Not connected")
+            state = "disconnected"
+        UnifiedStyles.set_state(label, "state", state)
+        # "Failed" znika sam po chwili, nawet jeśli nic innego nie zmieni statusu
+        if state == "failed":
+            self.failed_status_timer.start()
+        else:
+            self.failed_status_timer.stop()
 
     def handle_connect_request(self, ssid, password, remember):
         self.go_back_to_list()
         self.update_status_label(ssid, "connecting")
         
-        # Jeśli remember jest True, można tu zapisać hasło w ConfigManager
+        # Zapamiętana sieć trafia do indeksu, z którego korzysta auto-connect
         if remember:
-            # self.config.save_network(ssid, password) # Jeśli zaimplementowane
-            pass
+            self.config.save_network(ssid, password)
+
+        # Nie blokuje GUI - wynik przyjdzie sygnałem connect_finished
+        self.network_manager.start_connect(ssid, password)
 
-        self.network_manager.connect_to_network(ssid, password)
+    def on_connect_finished(self, result):
+        if not result.success:
+            print(f"[UI] Connection to {result.ssid} failed: {result.reason_text}")
+            self.update_status_label(result.ssid, "failed", result.reason_text)
         self.trigger_initial_scan()
 
     def on_connection_changed(self, ssid):
-        self.network_manager.current_network = ssid
-        if ssid: 
-            self.update_status_label(ssid, "connected")
-        else: 
-            self.update_status_label(None, "disconnected")
+        self.show_connection_status(ssid)
         self.trigger_initial_scan()
 
     def on_wifi_toggle(self, state):
         self.wifi_on = state
+        self.network_manager.auto_connect.paused = not state
         self.apply_settings() # Re-aplikuj timery
         
         if state:
-            self.trigger_initial_scan()
             self.network_list.setEnabled(True)
+            # Lista została wyczyszczona przy wyłączeniu; jeśli skan zwróci te same sieci,
+            # backend nic nie opublikuje - rysujemy więc od razu bieżący snapshot
+            self.on_networks_updated(self.network_manager.snapshot)
+            self.trigger_initial_scan(active=True)
             current = self.network_manager.current_network
             if current: self.update_status_label(current, "connected")
             else: self.update_status_label(None, "disconnected")
         else:
             self.update_status_label(None, "off")
             self.network_list.display_networks([])
+            self._rendered_version = None
             self.network_list.setEnabled(False)
             self.scan_timer.stop()
 
-    def trigger_initial_scan(self):
+    def trigger_initial_scan(self, active=False):
+        """Odświeża listę sieci.
+
+        Domyślnie pasywnie: tabela AP w backendzie jest na bieżąco dzięki sygnałom NM, więc
+        timer i reakcje na zdarzenia tylko ją publikują. Skan radiowy (active=True, RequestScan
+        na adapterach) tylko na wyraźne działanie użytkownika - otwarcie okna, włączenie Wi-Fi.
+        """
         # Nie skanuj, jeśli użytkownik wpisuje hasło lub wifi wyłączone
         if not self.wifi_on or self.stacked_widget.currentWidget() == self.connection_form: 
             return
         
-        def scan():
-            nets = self.network_manager.scan_networks() if hasattr(self.network_manager, "scan_networks") else []
-            self.networks_updated.emit(nets)
-        
-        threading.Thread(target=scan, daemon=True).start()
+        # Wynik przyjdzie przez network_changed -> networks_updated
+        self.network_manager.start_scan(active=active)
 
     # --- NAWIGACJA UI ---
 
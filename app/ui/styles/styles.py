@@ -1,490 +1,527 @@
+from functools import lru_cache
+from string import Template
+
+from PyQt5.QtGui import QColor, QGuiApplication
+
+THEMES = ("dark", "light")
+AUTO_THEME = "auto"
+
+# Tokeny palety - jedyne miejsce, w którym motywy się różnią. Arkusz (_TEMPLATE) jest wspólny,
+# a tokeny `list_*` (format #AARRGGBB dla QColor) czyta NetworkItemDelegate przy rysowaniu wierszy.
+TOKENS = {
+    "dark": {  # DEEP DARK EMERALD
+        "text": "#f1f5f9",                              # Slate 50
+        "accent": "#10b981",
+        "window_bg": "#0a0e1a",                         # Prawie czarny
+        "window_border": "rgba(16, 185, 129, 0.2)",
+        "bar_bg": "#0a0e1a",
+        "bar_border": "rgba(255, 255, 255, 0.05)",
+        "title": "#ffffff",
+        "back_hover_bg": "rgba(16, 185, 129, 0.1)",
+        "settings_btn_hover_fg": "#34d399",
+        "settings_btn_hover_bg": "transparent",
+        "btn_bg": "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #10b981, stop:1 #059669)",
+        "btn_hover": "#10b981",
+        "btn_pressed": "#047857",
+        "btn_pressed_padding": "6px",
+        "btn_disabled_bg": "rgba(255, 255, 255, 0.05)",
+        "btn_disabled_fg": "rgba(255, 255, 255, 0.3)",
+        "input_bg": "rgba(255, 255, 255, 0.05)",
+        "input_focus_bg": "rgba(255, 255, 255, 0.08)",
+        "input_border": "rgba(255, 255, 255, 0.1)",
+        "input_fg": "white",
+        "input_selection": "#10b981",
+        "checkbox_fg": "#cbd5e1",
+        "indicator_bg": "rgba(255, 255, 255, 0.05)",
+        "indicator_border": "rgba(255, 255, 255, 0.3)",
+        "popup_bg": "#0a0e1a",
+        "popup_fg": "white",
+        "popup_selection_bg": "#10b981",
+        "popup_selection_fg": "white",
+        "group_border": "rgba(255, 255, 255, 0.1)",
+        "scroll_track": "transparent",
+        "scroll_handle": "rgba(255, 255, 255, 0.1)",
+        "scroll_handle_hover": "rgba(255, 255, 255, 0.2)",
+        "badge_bg": "rgba(16, 185, 129, 0.1)",
+        "badge_border": "rgba(16, 185, 129, 0.3)",
+        "heading": "white",
+        "muted": "#a1a1aa",
+        "status": "#94a3b8",
+        "status_connecting": "#f59e0b",
+        "status_failed": "#ef4444",
+        "status_off": "#71717a",
+        "settings_label": "#e4e4e7",
+        "settings_group_bg": "rgba(24, 24, 27, 0.65)",
+        "settings_border": "rgba(16, 185, 129, 0.35)",
+        "settings_border_hover": "rgba(16, 185, 129, 0.55)",
+        "settings_indicator_bg": "rgba(255, 255, 255, 0.06)",
+        "settings_indicator_border": "rgba(16, 185, 129, 0.5)",
+        "settings_indicator_hover": "rgba(16, 185, 129, 0.8)",
+        "settings_combo_bg": "rgba(255, 255, 255, 0.07)",
+        "settings_combo_fg": "#ffffff",
+        "settings_popup_border": "#333",
+        "settings_popup_selection": "rgba(16, 185, 129, 0.35)",
+        "settings_popup_fg": "#e4e4e7",
+        "list_name": "#f1f5f9",
+        "list_status": "#94a3b8",
+        "list_accent": "#10b981",
+        "list_chevron": "#475569",
+        "list_hover": "#0affffff",          # rgba(255, 255, 255, 0.04)
+        "list_connected_bg": "#1410b981",   # rgba(16, 185, 129, 0.08)
+        "list_button_border": "#4d10b981",  # rgba(16, 185, 129, 0.3)
+        "list_button_hover": "#1a10b981",   # rgba(16, 185, 129, 0.1)
+    },
+    "light": {  # CLEAN LIGHT
+        "text": "#1e293b",                              # Slate 800
+        "accent": "#059669",                            # Emerald 600 (ciemniejszy na jasnym tle)
+        "window_bg": "#ffffff",
+        "window_border": "#cbd5e1",                     # Slate 300
+        "bar_bg": "#f8fafc",                            # Slate 50
+        "bar_border": "#e2e8f0",
+        "title": "#059669",
+        "back_hover_bg": "#e2e8f0",
+        "settings_btn_hover_fg": "#059669",
+        "settings_btn_hover_bg": "#e2e8f0",
+        "btn_bg": "#059669",
+        "btn_hover": "#047857",
+        "btn_pressed": "#065f46",
+        "btn_pressed_padding": "7px",
+        "btn_disabled_bg": "#cbd5e1",
+        "btn_disabled_fg": "#94a3b8",
+        "input_bg": "#ffffff",
+        "input_focus_bg": "#f8fafc",
+        "input_border": "#cbd5e1",
+        "input_fg": "#0f172a",
+        "input_selection": "#34d399",
+        "checkbox_fg": "#334155",
+        "indicator_bg": "#f1f5f9",
+        "indicator_border": "#94a3b8",
+        "popup_bg": "#ffffff",
+        "popup_fg": "#0f172a",
+        "popup_selection_bg": "#d1fae5",
+        "popup_selection_fg": "#064e3b",
+        "group_border": "#e2e8f0",
+        "scroll_track": "#f1f5f9",
+        "scroll_handle": "#cbd5e1",
+        "scroll_handle_hover": "#94a3b8",
+        "badge_bg": "#ecfdf5",                          # Emerald 50
+        "badge_border": "#a7f3d0",
+        "heading": "#0f172a",                           # Slate 900
+        "muted": "#64748b",                             # Slate 500
+        "status": "#64748b",
+        "status_connecting": "#d97706",
+        "status_failed": "#dc2626",
+        "status_off": "#94a3b8",
+        "settings_label": "#334155",
+        "settings_group_bg": "#f8fafc",
+        "settings_border": "#a7f3d0",
+        "settings_border_hover": "#059669",
+        "settings_indicator_bg": "#ffffff",
+        "settings_indicator_border": "#94a3b8",
+        "settings_indicator_hover": "#059669",
+        "settings_combo_bg": "#ffffff",
+        "settings_combo_fg": "#0f172a",
+        "settings_popup_border": "#cbd5e1",
+        "settings_popup_selection": "#d1fae5",
+        "settings_popup_fg": "#0f172a",
+        "list_name": "#0f172a",
+        "list_status": "#64748b",
+        "list_accent": "#059669",
+        "list_chevron": "#94a3b8",
+        "list_hover": "#f1f5f9",
+        "list_connected_bg": "#ecfdf5",
+        "list_button_border": "#a7f3d0",
+        "list_button_hover": "#d1fae5",
+    },
+}
+
+# Wspólny arkusz dla wszystkich motywów; $token podmieniany raz na motyw (get_stylesheet)
+_TEMPLATE = Template("""
+    QWidget {
+        background: transparent;
+        color: $text;
+        font-family: 'Segoe UI', 'Inter', system-ui, sans-serif;
+        font-size: 13px;
+        border: none;
+        outline: none;
+    }
+
+    /* --- WINDOW & CONTAINERS --- */
+    QWidget#main_window {
+        background-color: $window_bg;
+        border-radius: 16px;
+        border: 1px solid $window_border;
+    }
+
+    QWidget#main_header {
+        background-color: $bar_bg;
+        border-bottom: 1px solid $bar_border;
+        border-top-left-radius: 16px;
+        border-top-right-radius: 16px;
+    }
+
+    QWidget#bottom_bar {
+        background-color: $bar_bg;
+        border-top: 1px solid $bar_border;
+        border-bottom-left-radius: 16px;
+        border-bottom-right-radius: 16px;
+    }
+
+    QStackedWidget {
+        background-color: $window_bg;
+    }
+
+    /* --- TYPOGRAPHY --- */
+    QLabel#header_title {
+        font-size: 16px;
+        font-weight: 800;
+        color: $title;
+        letter-spacing: 0.5px;
+    }
+
+    /* --- NETWORK LIST (wiersze rysuje NetworkItemDelegate) --- */
+    QListView#network_list {
+        background: transparent;
+        border: none;
+    }
+
+    /* --- STATUS BAR (właściwość state: connected/connecting/failed/off/disconnected) --- */
+    QLabel#network_status {
+        color: $status;
+        font-size: 12px;
+    }
+    QLabel#network_status[state="connected"] {
+        color: $accent;
+        font-weight: bold;
+    }
+    QLabel#network_status[state="connecting"] {
+        color: $status_connecting;
+        font-weight: 500;
+    }
+    QLabel#network_status[state="failed"] {
+        color: $status_failed;
+        font-weight: 500;
+    }
+    QLabel#network_status[state="off"] {
+        color: $status_off;
+    }
+
+    /* --- BUTTONS --- */
+    QPushButton#header_back_btn {
+        background: transparent;
+        color: $accent;
+        font-size: 24px;
+        font-weight: bold;
+        border: none;
+    }
+    QPushButton#header_back_btn:hover {
+        background: $back_hover_bg;
+        border-radius: 8px;
+    }
+
+    QPushButton#settings_btn {
+        background: transparent;
+        font-size: 18px;
+        color: $accent;
+    }
+    QPushButton#settings_btn:hover {
+        color: $settings_btn_hover_fg;
+        background: $settings_btn_hover_bg;
+        border-radius: 6px;
+    }
+
+    /* Action Buttons (Connect) */
+    .btn-primary {
+        background: $btn_bg;
+        color: white;
+        font-weight: 700;
+        font-size: 13px;
+        border-radius: 8px;
+        border: none;
+        padding: 6px 12px;
+    }
+    .btn-primary:hover {
+        background: $btn_hover;
+    }
+    .btn-primary:pressed {
+        background: $btn_pressed;
+        padding-top: $btn_pressed_padding;
+    }
+    .btn-primary:disabled {
+        background: $btn_disabled_bg;
+        color: $btn_disabled_fg;
+    }
+
+    /* --- INPUTS & CONTROLS --- */
+    QLineEdit {
+        background: $input_bg;
+        border: 1px solid $input_border;
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: $input_fg;
+        font-size: 13px;
+        selection-background-color: $input_selection;
+    }
+    QLineEdit:focus {
+        border: 1px solid $accent;
+        background: $input_focus_bg;
+    }
+
+    QCheckBox {
+        spacing: 8px;
+        color: $checkbox_fg;
+        font-size: 12px;
+        font-weight: 500;
+    }
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        background: $indicator_bg;
+        border: 1px solid $indicator_border;
+        border-radius: 4px;
+    }
+    QCheckBox::indicator:checked {
+        background-color: $accent;
+        border: 1px solid $accent;
+    }
+
+    QComboBox {
+        background: $input_bg;
+        border: 1px solid $input_border;
+        border-radius: 6px;
+        padding: 4px 8px;
+        color: $input_fg;
+        min-width: 60px;
+    }
+    QComboBox:hover {
+        border: 1px solid $accent;
+    }
+    QComboBox::drop-down {
+        border: none;
+        background: transparent;
+    }
+    QComboBox QAbstractItemView {
+        background: $popup_bg;
+        color: $popup_fg;
+        border: 1px solid $input_border;
+        selection-background-color: $popup_selection_bg;
+        selection-color: $popup_selection_fg;
+    }
+
+    QGroupBox {
+        border: 1px solid $group_border;
+        border-radius: 8px;
+        margin-top: 8px;
+        padding-top: 12px;
+        font-weight: bold;
+        color: $accent;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 5px;
+        left: 10px;
+        background: transparent;
+    }
+
+    /* --- SCROLLBAR --- */
+    QScrollArea { background: transparent; }
+    QScrollBar:vertical {
+        background: $scroll_track;
+        width: 6px;
+        border-radius: 3px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: $scroll_handle;
+        min-height: 20px;
+        border-radius: 3px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: $scroll_handle_hover;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical,
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+        height: 0px;
+    }
+
+    /* --- CONNECTION FORM SPECIFIC --- */
+    QLabel#connection_icon_large {
+        background: $badge_bg;
+        color: $accent;
+        border-radius: 32px;
+        font-size: 32px;
+        border: 1px solid $badge_border;
+    }
+    QLabel#connection_ssid_large {
+        font-size: 18px;
+        font-weight: 700;
+        color: $heading;
+        margin-top: 10px;
+    }
+    QLabel#connection_status {
+        color: $muted;
+        font-size: 12px;
+    }
+
+    /* --- SETTINGS --- */
+    QLabel#settings_title {
+        font-size: 16px;
+        font-weight: 700;
+        color: $accent;
+    }
+    QWidget#settings_page QLabel.settings-label {
+        color: $settings_label;
+        font-size: 11px;
+        font-weight: 600;
+    }
+    QWidget#settings_page QGroupBox {
+        background: $settings_group_bg;
+        border: 1.2px solid $settings_border;
+        border-radius: 7px;
+        margin-top: 5px;
+        padding: 10px 10px 6px 10px;
+        font-size: 11px;
+        color: $accent;
+        font-weight: 600;
+    }
+    QWidget#settings_page QGroupBox::title {
+        color: $accent;
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 5px;
+        background: transparent;
+    }
+    QWidget#settings_page QCheckBox {
+        color: $settings_label;
+        spacing: 8px;
+        font-size: 11px;
+        font-weight: 500;
+        padding: 3px 0px;
+    }
+    QWidget#settings_page QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border: 1.5px solid $settings_indicator_border;
+        border-radius: 3px;
+        background: $settings_indicator_bg;
+    }
+    QWidget#settings_page QCheckBox::indicator:checked {
+        background: $accent;
+        border: 1.5px solid $accent;
+    }
+    QWidget#settings_page QCheckBox::indicator:hover {
+        border: 1.5px solid $settings_indicator_hover;
+    }
+    QWidget#settings_page QComboBox {
+        background: $settings_combo_bg;
+        border: 1.2px solid $settings_border;
+        border-radius: 5px;
+        padding: 3px 6px;
+        color: $settings_combo_fg;
+        font-size: 11px;
+        min-width: 80px;
+    }
+    QWidget#settings_page QComboBox:hover {
+        border: 1.2px solid $settings_border_hover;
+    }
+    QWidget#settings_page QComboBox QAbstractItemView {
+        background: $popup_bg;
+        border: 1px solid $settings_popup_border;
+        selection-background-color: $settings_popup_selection;
+        color: $settings_popup_fg;
+    }
+""")
+
+
 class UnifiedStyles:
+    """Jedyne źródło stylów aplikacji - arkusz ustawiany raz na QApplication.
+
+    Widżety nie wołają własnego setStyleSheet: dostają objectName (albo właściwość `class`),
+    a stany (np. kolor statusu) przełączają dynamiczną właściwością przez `set_state`,
+    co kosztuje tylko ponowne dopasowanie reguł dla jednego widżetu, bez parsowania CSS.
+
+    Arkusze powstają z jednego szablonu i tokenów palety, raz na motyw. `apply` ustawia
+    arkusz tylko, gdy zmienia się faktyczny motyw; tryb "auto" wybiera dark/light wg jasności
+    palety pulpitu i przełącza się sam, gdy system zmieni schemat kolorów.
+    """
+
+    _requested = None   # motyw z configu (dark/light/auto)
+    _applied = None     # faktycznie ustawiony arkusz (dark/light)
+    _watching = False
+
+    @staticmethod
+    def repolish(widget):
+        """Ponownie dopasowuje reguły arkusza do widżetu (po zmianie właściwości)."""
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+
+    @staticmethod
+    def set_state(widget, name, value):
+        """Ustawia dynamiczną właściwość używaną w selektorach; repolish tylko przy faktycznej zmianie."""
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        UnifiedStyles.repolish(widget)
+
+    @staticmethod
+    def resolve_theme(theme=None):
+        """Nazwa motywu z configu -> "dark"/"light" ("auto" wg jasności tła palety systemowej)."""
+        theme = (theme or "dark").lower()
+        if theme == AUTO_THEME:
+            app = QGuiApplication.instance()
+            if app is None:
+                return "dark"
+            return "light" if app.palette().window().color().lightness() >= 128 else "dark"
+        return theme if theme in THEMES else "dark"
+
     @staticmethod
     def get_stylesheet(theme="dark"):
-        if theme.lower() == "light":
-            return UnifiedStyles._get_light_theme()
-        else:
-            return UnifiedStyles._get_dark_theme()
+        return _compiled_stylesheet(UnifiedStyles.resolve_theme(theme))
+
+    @staticmethod
+    def current_theme():
+        return UnifiedStyles._applied or "dark"
+
+    @staticmethod
+    def list_colors():
+        """Tokeny `list_*` aktualnego motywu jako QColor (bez prefiksu) - dla NetworkItemDelegate."""
+        return _list_colors(UnifiedStyles.current_theme())
 
     @staticmethod
-    def _get_dark_theme():
-        return """
-            /* =======================================================
-               THEME: DEEP DARK EMERALD
-               ======================================================= */
-
-            QWidget {
-                background: transparent;
-                color: #f1f5f9; /* Slate 50 */
-                font-family: 'Segoe UI', 'Inter', system-ui, sans-serif;
-                font-size: 13px;
-                border: none;
-                outline: none;
-            }
-
-            /* --- WINDOW & CONTAINERS --- */
-            QWidget#main_window {
-                background-color: #0a0e1a; /* DEEP DARK BG (Prawie czarny) */
-                border-radius: 16px;
-                border: 1px solid rgba(16, 185, 129, 0.2);
-            }
-
-            QWidget#main_header {
-                background-color: #0a0e1a;
-                border-bottom: 1px solid rgba(255, 255, 255, 0.05);
-                border-top-left-radius: 16px;
-                border-top-right-radius: 16px;
-            }
-
-            QWidget#bottom_bar {
-                background-color: #0a0e1a;
-                border-top: 1px solid rgba(255, 255, 255, 0.05);
-                border-bottom-left-radius: 16px;
-                border-bottom-right-radius: 16px;
-            }
-
-            QStackedWidget {
-                background-color: #0a0e1a;
-            }
-
-            /* --- TYPOGRAPHY --- */
-            QLabel#header_title {
-                font-size: 16px;
-                font-weight: 800;
-                color: #ffffff;
-                letter-spacing: 0.5px;
-            }
-
-            /* --- NETWORK LIST ITEMS --- */
-            QFrame#network_item_frame {
-                background: transparent;
-            }
-
-            QFrame#inner_container {
-                background-color: transparent; /* Minimalistyczny start */
-                border-radius: 12px;
-                border: none;
-            }
-
-            QFrame#inner_container:hover {
-                background-color: rgba(255, 255, 255, 0.04); /* Subtelne podświetlenie */
-            }
-
-            QFrame#inner_container[connected="true"] {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(16, 185, 129, 0.15),
-                    stop:1 rgba(16, 185, 129, 0.05));
-                /* Bez ramki, sam gradient */
-            }
-
-            QLabel#network_name {
-                color: #ffffff;
-                font-weight: 600;
-                font-size: 14px;
-            }
-            
-            QLabel#network_status {
-                color: #64748b; /* Slate 500 */
-                font-size: 11px;
-            }
-
-            /* Minimalistyczna kłódka bez tła */
-            QLabel#secured_indicator {
-                background: transparent;
-                color: #10b981;
-                font-size: 10px;
-                font-weight: bold;
-                padding: 0px;
-            }
-
-            /* --- BUTTONS --- */
-            QPushButton#header_back_btn {
-                background: transparent;
-                color: #10b981;
-                font-size: 24px;
-                font-weight: bold;
-                border: none;
-            }
-            QPushButton#header_back_btn:hover {
-                background: rgba(16, 185, 129, 0.1);
-                border-radius: 8px;
-            }
-
-            QPushButton#settings_btn {
-                background: transparent;
-                font-size: 18px;
-                color: #10b981;
-            }
-            QPushButton#settings_btn:hover {
-                color: #34d399;
-            }
-
-            /* Action Buttons (Connect) */
-            .btn-primary {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #10b981, stop:1 #059669);
-                color: white;
-                font-weight: 700;
-                font-size: 13px;
-                border-radius: 8px;
-                border: none;
-                padding: 6px 12px;
-            }
-            .btn-primary:hover {
-                background: #10b981;
-            }
-            .btn-primary:pressed {
-                background: #047857;
-            }
-            .btn-primary:disabled {
-                background: rgba(255, 255, 255, 0.05);
-                color: rgba(255, 255, 255, 0.3);
-            }
-
-            /* --- INPUTS & CONTROLS --- */
-            QLineEdit {
-                background: rgba(255, 255, 255, 0.05);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: white;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #10b981;
-                background: rgba(255, 255, 255, 0.08);
-            }
-
-            QCheckBox {
-                spacing: 8px;
-                color: #cbd5e1;
-                font-size: 12px;
-                font-weight: 500;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                background: rgba(255, 255, 255, 0.05);
-                border: 1px solid rgba(255, 255, 255, 0.3);
-                border-radius: 4px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #10b981;
-                border: 1px solid #10b981;
-            }
-
-            QComboBox {
-                background: rgba(255, 255, 255, 0.05);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 6px;
-                padding: 4px 8px;
-                color: white;
-                min-width: 60px;
-            }
-            QComboBox:hover {
-                border: 1px solid #10b981;
-            }
-            QComboBox::drop-down {
-                border: none;
-                background: transparent;
-            }
-            QComboBox QAbstractItemView {
-                background: #0a0e1a;
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                selection-background-color: #10b981;
-            }
-
-            QGroupBox {
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-                margin-top: 8px;
-                padding-top: 12px;
-                font-weight: bold;
-                color: #10b981;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 5px;
-                left: 10px;
-            }
-
-            /* --- SCROLLBAR --- */
-            QScrollArea { background: transparent; }
-            QScrollBar:vertical {
-                background: transparent;
-                width: 6px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                min-height: 20px;
-                border-radius: 3px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.2);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical,
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-                height: 0px;
-            }
-            
-            /* --- CONNECTION FORM SPECIFIC --- */
-            QLabel#connection_icon_large {
-                background: rgba(16, 185, 129, 0.1);
-                color: #10b981;
-                border-radius: 32px;
-                font-size: 32px;
-                border: 1px solid rgba(16, 185, 129, 0.3);
-            }
-            QLabel#connection_ssid_large {
-                font-size: 18px;
-                font-weight: 700;
-                color: white;
-                margin-top: 10px;
-            }
+    def apply(app, theme):
+        """Ustawia arkusz motywu na całej aplikacji; zwraca True, jeśli coś się zmieniło.
+
+        Ten sam (rozwiązany) motyw nie jest ustawiany drugi raz - setStyleSheet na QApplication
+        re-polishuje wszystkie widżety, więc przy starcie dzieje się to dokładnie raz.
         """
+        UnifiedStyles._requested = (theme or "dark").lower()
+        if not UnifiedStyles._watching:
+            # Palety pulpitu nie zmienia nasz arkusz, tylko system (zmiana schematu kolorów)
+            app.paletteChanged.connect(lambda _palette: UnifiedStyles._follow_system(app))
+            UnifiedStyles._watching = True
+
+        resolved = UnifiedStyles.resolve_theme(theme)
+        if resolved == UnifiedStyles._applied:
+            return False
+        app.setStyleSheet(_compiled_stylesheet(resolved))
+        UnifiedStyles._applied = resolved
+        return True
 
     @staticmethod
-    def _get_light_theme():
-        return """
-            /* =======================================================
-               THEME: CLEAN LIGHT
-               ======================================================= */
-
-            QWidget {
-                background: transparent;
-                color: #1e293b; /* Slate 800 */
-                font-family: 'Segoe UI', 'Inter', system-ui, sans-serif;
-                font-size: 13px;
-                border: none;
-                outline: none;
-            }
-
-            /* --- WINDOW & CONTAINERS --- */
-            QWidget#main_window {
-                background-color: #ffffff; /* White */
-                border-radius: 16px;
-                border: 1px solid #cbd5e1; /* Slate 300 */
-            }
-
-            QWidget#main_header {
-                background-color: #f8fafc; /* Slate 50 */
-                border-bottom: 1px solid #e2e8f0;
-                border-top-left-radius: 16px;
-                border-top-right-radius: 16px;
-            }
-
-            QWidget#bottom_bar {
-                background-color: #f8fafc;
-                border-top: 1px solid #e2e8f0;
-                border-bottom-left-radius: 16px;
-                border-bottom-right-radius: 16px;
-            }
-
-            QStackedWidget {
-                background-color: #ffffff;
-            }
-
-            /* --- TYPOGRAPHY --- */
-            QLabel#header_title {
-                font-size: 16px;
-                font-weight: 800;
-                color: #059669; /* Emerald 600 (Darker for light bg) */
-                letter-spacing: 0.5px;
-            }
-
-            /* --- NETWORK LIST ITEMS --- */
-            QFrame#network_item_frame {
-                background: transparent;
-            }
-
-            QFrame#inner_container {
-                background-color: transparent;
-                border-radius: 12px;
-                border: 1px solid transparent;
-            }
-
-            QFrame#inner_container:hover {
-                background-color: #f1f5f9; /* Slate 100 */
-            }
-
-            QFrame#inner_container[connected="true"] {
-                background-color: #ecfdf5; /* Emerald 50 */
-                border: 1px solid #a7f3d0;
-            }
-
-            QLabel#network_name {
-                color: #0f172a; /* Slate 900 */
-                font-weight: 600;
-                font-size: 14px;
-            }
-            
-            QLabel#network_status {
-                color: #64748b; /* Slate 500 */
-                font-size: 11px;
-            }
-
-            QLabel#secured_indicator {
-                background: transparent;
-                color: #059669; /* Emerald 600 */
-                font-size: 10px;
-                font-weight: bold;
-                padding: 0px;
-            }
-
-            /* --- BUTTONS --- */
-            QPushButton#header_back_btn {
-                background: transparent;
-                color: #059669;
-                font-size: 24px;
-                font-weight: bold;
-                border: none;
-            }
-            QPushButton#header_back_btn:hover {
-                background: #e2e8f0;
-                border-radius: 8px;
-            }
-
-            QPushButton#settings_btn {
-                background: transparent;
-                font-size: 18px;
-                color: #059669;
-            }
-            QPushButton#settings_btn:hover {
-                background: #e2e8f0;
-                border-radius: 6px;
-            }
-
-            /* Action Buttons */
-            .btn-primary {
-                background: #059669;
-                color: white;
-                font-weight: 700;
-                font-size: 13px;
-                border-radius: 8px;
-                border: none;
-                padding: 6px 12px;
-            }
-            .btn-primary:hover {
-                background: #047857;
-            }
-            .btn-primary:pressed {
-                background: #065f46;
-                padding-top: 7px;
-            }
-            .btn-primary:disabled {
-                background: #cbd5e1;
-                color: #94a3b8;
-            }
-
-            /* --- INPUTS & CONTROLS --- */
-            QLineEdit {
-                background: #ffffff;
-                border: 1px solid #cbd5e1;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #0f172a;
-                font-size: 13px;
-                selection-background-color: #34d399;
-            }
-            QLineEdit:focus {
-                border: 1px solid #059669;
-                background: #f8fafc;
-            }
-
-            QCheckBox {
-                spacing: 8px;
-                color: #334155;
-                font-size: 12px;
-                font-weight: 500;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                background: #f1f5f9;
-                border: 1px solid #94a3b8;
-                border-radius: 4px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #059669;
-                border: 1px solid #059669;
-            }
-
-            QComboBox {
-                background: #ffffff;
-                border: 1px solid #cbd5e1;
-                border-radius: 6px;
-                padding: 4px 8px;
-                color: #0f172a;
-                min-width: 60px;
-            }
-            QComboBox:hover {
-                border: 1px solid #059669;
-            }
-            QComboBox::drop-down {
-                border: none;
-                background: transparent;
-            }
-            QComboBox QAbstractItemView {
-                background: #ffffff;
-                color: #0f172a;
-                border: 1px solid #cbd5e1;
-                selection-background-color: #d1fae5;
-                selection-color: #064e3b;
-            }
-
-            QGroupBox {
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-                margin-top: 8px;
-                padding-top: 12px;
-                font-weight: bold;
-                color: #059669;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 5px;
-                left: 10px;
-                background: transparent;
-            }
-
-            /* --- SCROLLBAR --- */
-            QScrollArea { background: transparent; }
-            QScrollBar:vertical {
-                background: #f1f5f9;
-                width: 6px;
-                border-radius: 3px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #cbd5e1;
-                min-height: 20px;
-                border-radius: 3px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #94a3b8;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical,
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-                height: 0px;
-            }
-            
-            /* --- CONNECTION FORM SPECIFIC --- */
-            QLabel#connection_icon_large {
-                background: #ecfdf5;
-                color: #059669;
-                border-radius: 32px;
-                font-size: 32px;
-                border: 1px solid #a7f3d0;
-            }
-            QLabel#connection_ssid_large {
-                font-size: 18px;
-                font-weight: 700;
-                color: #0f172a;
-            }
-        """
\ No newline at end of file
+    def _follow_system(app):
+        if UnifiedStyles._requested == AUTO_THEME and UnifiedStyles.apply(app, AUTO_THEME):
+            print(f"[UI] System colour scheme changed, theme: {UnifiedStyles._applied}")
+
+
+@lru_cache(maxsize=None)
+def _compiled_stylesheet(theme):
+    return _TEMPLATE.substitute(TOKENS[theme])
+
+
+@lru_cache(maxsize=None)
+def _list_colors(theme):
+    return {name[len("list_"):]: QColor(value) for name, value in TOKENS[theme].items() if name.startswith("list_")}
@@ -1,39 +1,38 @@
 import sys
-import os
 from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction
-from PyQt5.QtGui import QIcon, QPixmap, QPainter, QPen, QBrush, QColor
-from PyQt5.QtCore import QTimer, Qt, QSize
+from PyQt5.QtCore import QTimer
 from app.ui.main_wifi import ModernWifiWindow
 from app.logic.network_manager import NetworkManager
+from app.logic.signal_history import signal_level
 from app.config import ConfigManager
 from app.ui.styles.styles import UnifiedStyles
+from app.ui import icons
 
 class WifiManagerApp:
     def __init__(self):
         self.app = QApplication(sys.argv)
         self.config = ConfigManager()
-        self.network_manager = NetworkManager()
+        self.network_manager = NetworkManager(self.config)
         self.current_icon_level = -1  
         self.setup_app()
 
     def setup_app(self):
-        self.app.setStyleSheet(UnifiedStyles.get_stylesheet())
+        UnifiedStyles.apply(self.app, self.config.get('theme', 'dark'))
         self.app.setApplicationName("Wi-Fi Manager")
         self.app.setApplicationVersion("1.0.0")
         self.app.setQuitOnLastWindowClosed(False)
         self.main_window = ModernWifiWindow(self.network_manager, self.config)
         self.main_window.hide()
         
-        self.main_window.networks_updated.connect(self.update_tray_icon_based_on_signal)
-        
         self.setup_tray_icon()
         
+        # Tray reacts to pushed changes of the connected AP's strength and to the Wi-Fi switch
+        self.network_manager.active_signal_changed.connect(self.update_tray_icon_based_on_signal)
+        self.main_window.wifi_toggle.toggled.connect(
+            lambda _state: self.update_tray_icon_based_on_signal(*self.network_manager.active_signal))
+        
         if self.config.get('auto_scan', True):
             QTimer.singleShot(1000, self.main_window.trigger_initial_scan)
-        
-        self.icon_update_timer = QTimer()
-        self.icon_update_timer.timeout.connect(self.update_tray_icon_based_on_signal)
-        self.icon_update_timer.start(5000)  # Update every 5 seconds
 
     def setup_tray_icon(self):
         icon = self.load_wifi_icon(3)  
@@ -57,54 +56,15 @@ class WifiManagerApp:
         """
         Load WiFi icon based on signal level
         signal_level: 0 = no connection/off, 1 = weak (1 bar), 2 = medium (2 bars), 3 = strong (3 bars)
+        Icons come from the shared cache - only the first request per level touches the disk.
         """
-        icon_paths = {
-            0: "./app/assets/wifi_0.png",  # No connection or WiFi off
-            1: "./app/assets/wifi_1.png",  # 1 bar
-            2: "./app/assets/wifi_2.png",  # 2 bars
-            3: "./app/assets/wifi.png",    # 3 bars (full)
-        }
-        
-        icon_path = icon_paths.get(signal_level, "./app/assets/wifi.png")
-        
-        if os.path.exists(icon_path):
-            print(f"Loading icon from: {icon_path}")
-            pixmap = QPixmap(icon_path)
-            scaled_pixmap = pixmap.scaledToWidth(48, Qt.SmoothTransformation)
-            icon = QIcon(scaled_pixmap)
-            icon.addPixmap(scaled_pixmap, QIcon.Normal)
-            icon.addPixmap(scaled_pixmap, QIcon.Active)
-            
-            if not icon.isNull():
-                return icon
-        
-        # Fallback to generated icon
-        return self.create_wifi_icon()
+        return icons.tray_icon(signal_level)
 
     def create_wifi_icon(self):
-        """Fallback: create a simple WiFi icon programmatically"""
-        pixmap = QPixmap(64, 64)
-        pixmap.fill(Qt.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        pen = QPen(QColor(255, 255, 255), 4)
-        painter.setPen(pen)
-        
-        # Draw WiFi arcs
-        painter.drawArc(10, 20, 44, 44, 0, 180 * 16)
-        painter.drawArc(18, 28, 28, 28, 0, 180 * 16)
-        painter.drawArc(26, 36, 12, 12, 0, 180 * 16)
-        
-        # Draw center dot
-        painter.setBrush(QBrush(QColor(255, 255, 255)))
-        painter.drawEllipse(28, 46, 8, 8)
-        
-        painter.end()
-        return QIcon(pixmap)
+        """Fallback: simple WiFi icon drawn programmatically (rendered once, cached)"""
+        return icons.fallback_wifi_icon()
 
-    def update_tray_icon_based_on_signal(self, networks=None):
+    def update_tray_icon_based_on_signal(self, current_network="", signal_strength=0):
         """Update tray icon based on current connection signal strength"""
         if not self.main_window.wifi_on:
             # WiFi is off
@@ -114,8 +74,6 @@ class WifiManagerApp:
                 self.current_icon_level = 0
             return
         
-        current_network = self.network_manager.current_network
-        
         if not current_network:
             # Not connected
             if self.current_icon_level != 0:
@@ -124,22 +82,8 @@ class WifiManagerApp:
                 self.current_icon_level = 0
             return
         
-        # Find signal strength of current network
-        signal_strength = 50  # Default medium strength
-        
-        if networks:
-            for net in networks:
-                if net['ssid'] == current_network:
-                    signal_strength = net['strength']
-                    break
-        
-        # Determine icon level based on signal strength
-        if signal_strength >= 70:
-            icon_level = 3  # Strong signal (3 bars)
-        elif signal_strength >= 40:
-            icon_level = 2  # Medium signal (2 bars)
-        else:
-            icon_level = 1  # Weak signal (1 bar)
+        # Determine icon level (1-3 bars) from the smoothed strength, with hysteresis around thresholds
+        icon_level = signal_level(signal_strength, self.current_icon_level)
         
         # Only update if icon level changed
         if icon_level != self.current_icon_level:
@@ -164,9 +108,10 @@ class WifiManagerApp:
         self.main_window.raise_()
         self.main_window.activateWindow()
         self.main_window.setFocus()  # Upewnij się, że okno ma fokus po pokazaniu
+        # Użytkownik otworzył listę - jedyny moment (poza włączeniem Wi-Fi), gdy skanujemy radiowo
+        self.main_window.trigger_initial_scan(active=True)
 
     def quit_application(self):
-        self.icon_update_timer.stop()
         self.tray_icon.hide()
         self.app.quit()
 